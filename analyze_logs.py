@@ -9,16 +9,96 @@ Analyzes all ping log files and categorizes IPs based on their response patterns
 """
 
 import glob
-from typing import Dict, Set, Tuple
-from collections import defaultdict
+import mmap
+import os
+import re
+from typing import Dict, Iterable, List, Optional, Tuple
+from collections import Counter
+from concurrent.futures import Executor, ProcessPoolExecutor
+from contextlib import nullcontext
 from datetime import datetime
+from itertools import chain
+from pathlib import Path
 from constants import (
     LOGS_DIR, ANALYSIS_NEVER_RESPONDED, ANALYSIS_ALWAYS_RESPONDED,
-    ANALYSIS_SOMETIMES_RESPONDED, ensure_directories
+    ANALYSIS_SOMETIMES_RESPONDED, ANALYSIS_WRITE_BUFFER_SIZE,
+    LOG_MMAP_THRESHOLD, ensure_directories
 )
 
+# Matches the IP (first tab-separated field) of every non-empty log line; the
+# field must start with a non-space character, so blank first fields are skipped
+_LOG_LINE_RE = re.compile(rb'^[^\S\n]*(\S[^\t\n]*)\t[^\n]*?\S', re.MULTILINE)
 
-def parse_log_files(log_dir: str = None) -> Tuple[Dict[str, int], Dict[str, int]]:
+# Header written at the top of each analysis file
+_HEADER_FMT = (
+    "# IPs that {} (analysis generated on {})\n"
+    "# Total IPs: {}\n"
+    "# Format: {}\n\n"
+)
+
+
+def _count_ips(file_path: str) -> Counter:
+    """
+    Count IP occurrences in a single log file.
+
+    The file is scanned as bytes with a single compiled regex pass, so no
+    per-line str objects are created. Files above LOG_MMAP_THRESHOLD are
+    memory-mapped; smaller ones are read in one call. Lines without a tab
+    separator are ignored.
+
+    Args:
+        file_path: Path to a success or failure log file
+
+    Returns:
+        Counter: IP (as bytes) -> count for this file
+    """
+    counts = Counter()
+    try:
+        with open(file_path, 'rb') as f:
+            size = os.fstat(f.fileno()).st_size
+
+            if size <= LOG_MMAP_THRESHOLD:
+                # Small files: a single read() is cheaper than setting up a mapping
+                counts.update(_LOG_LINE_RE.findall(f.read()))
+            else:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    counts.update(_LOG_LINE_RE.findall(mm))
+    except Exception as e:
+        print(f"Error reading {file_path}: {e}")
+    return counts
+
+
+def _count_files(file_paths: List[str], executor: Optional[Executor] = None) -> Dict[bytes, int]:
+    """
+    Count IP occurrences across log files, parsing files in parallel.
+
+    Each file is independent, so files are spread over the process pool and
+    each file's counts are merged as soon as it is parsed; only the running
+    totals are kept. Without an executor, or for a single file, files are
+    parsed inline. IPs stay as the raw bytes read from the logs, which are
+    smaller than str keys and never need decoding.
+
+    Args:
+        file_paths: Log files to parse
+        executor: Process pool to parse files in (optional)
+
+    Returns:
+        dict: IP (as bytes) -> total count across all files
+    """
+    totals = Counter()
+
+    if executor is not None and len(file_paths) > 1:
+        per_file = executor.map(_count_ips, file_paths, chunksize=8)
+    else:
+        per_file = map(_count_ips, file_paths)
+
+    for counts in per_file:
+        totals.update(counts)
+
+    return totals
+
+
+def parse_log_files(log_dir: str = None) -> Tuple[Dict[bytes, int], Dict[bytes, int]]:
     """
     Parse all log files in the directory and count successes/failures per IP.
 
@@ -26,7 +106,7 @@ def parse_log_files(log_dir: str = None) -> Tuple[Dict[str, int], Dict[str, int]
         log_dir: Directory containing log files (defaults to logs/ relative to script)
 
     Returns:
-        tuple: (success_counts, failure_counts) - dictionaries with IP as key, count as value
+        tuple: (success_counts, failure_counts) - dictionaries with IP (as bytes) as key, count as value
     """
     if log_dir is None:
         log_dir = str(LOGS_DIR)
@@ -35,129 +115,108 @@ def parse_log_files(log_dir: str = None) -> Tuple[Dict[str, int], Dict[str, int]
         print(f"Error: Log directory '{log_dir}' does not exist.")
         return {}, {}
 
-    success_counts = defaultdict(int)
-    failure_counts = defaultdict(int)
-
     # Find all log files
     success_files = glob.glob(str(LOGS_DIR / "*_successful.txt"))
     failure_files = glob.glob(str(LOGS_DIR / "*_failed.txt"))
 
     print(f"Found {len(success_files)} success log files and {len(failure_files)} failure log files")
 
-    # Parse success files
-    for file_path in success_files:
-        try:
-            with open(file_path, 'r') as f:
-                for line in f:
-                    line = line.strip()
-                    if line:
-                        parts = line.split('\t')
-                        if len(parts) >= 2:
-                            ip = parts[0]
-                            success_counts[ip] += 1
-        except Exception as e:
-            print(f"Error reading {file_path}: {e}")
-
-    # Parse failure files
-    for file_path in failure_files:
-        try:
-            with open(file_path, 'r') as f:
-                for line in f:
-                    line = line.strip()
-                    if line:
-                        parts = line.split('\t')
-                        if len(parts) >= 2:
-                            ip = parts[0]
-                            failure_counts[ip] += 1
-        except Exception as e:
-            print(f"Error reading {file_path}: {e}")
-
-    return dict(success_counts), dict(failure_counts)
-
-
-def categorize_ips(success_counts: Dict[str, int], failure_counts: Dict[str, int]) -> Tuple[Set[str], Set[str], Set[str]]:
+    # One process pool parses both sets of files; a single file is parsed inline
+    parallel = len(success_files) + len(failure_files) > 1
+    with ProcessPoolExecutor() if parallel else nullcontext() as executor:
+        success_counts = _count_files(success_files, executor)
+        failure_counts = _count_files(failure_files, executor)
+
+    return success_counts, failure_counts
+
+
+def _rate_line(ip: bytes, successes: int, failures: int) -> bytes:
     """
-    Categorize IPs based on their response patterns.
+    Format one line of the sometimes-responded analysis file.
 
     Args:
-        success_counts: Dictionary of IP -> success count
-        failure_counts: Dictionary of IP -> failure count
+        ip: IP address (as bytes)
+        successes: Success count
+        failures: Failure count
 
     Returns:
-        tuple: (never_responded, always_responded, sometimes_responded) sets
+        bytes: Tab-separated line with the success rate
     """
-    all_ips = set(success_counts.keys()) | set(failure_counts.keys())
-
-    never_responded = set()
-    always_responded = set()
-    sometimes_responded = set()
+    return b"%s\t%d\t%d\t%.1f%%\n" % (ip, successes, failures, successes / (successes + failures) * 100)
 
-    for ip in all_ips:
-        successes = success_counts.get(ip, 0)
-        failures = failure_counts.get(ip, 0)
 
-        if successes == 0 and failures > 0:
-            never_responded.add(ip)
-        elif failures == 0 and successes > 0:
-            always_responded.add(ip)
-        elif successes > 0 and failures > 0:
-            sometimes_responded.add(ip)
+def _write_analysis_file(file_path: Path, lines: Iterable[bytes]) -> None:
+    """
+    Write the lines of one analysis file in a single operation.
 
-    return never_responded, always_responded, sometimes_responded
+    Args:
+        file_path: Output file path
+        lines: Formatted lines (including headers) to write
+    """
+    with open(file_path, 'wb', buffering=ANALYSIS_WRITE_BUFFER_SIZE) as f:
+        f.write(b''.join(lines))
 
 
-def write_analysis_files(never_responded: Set[str], always_responded: Set[str],
-                        sometimes_responded: Set[str], success_counts: Dict[str, int],
-                        failure_counts: Dict[str, int]) -> None:
+def write_analysis_files(success_counts: Dict[bytes, int],
+                        failure_counts: Dict[bytes, int]) -> Tuple[int, int, int]:
     """
-    Write analysis results to files.
+    Categorize IPs by response pattern and write each category to its file.
+
+    Classification is done with set operations on the dictionary key views,
+    which run in C rather than as a per-IP Python loop. Each category is
+    sorted, formatted straight into its file and released before the next one
+    is built, so only one category is held in memory at a time.
 
     Args:
-        never_responded: Set of IPs that never responded
-        always_responded: Set of IPs that always responded
-        sometimes_responded: Set of IPs that sometimes responded
-        success_counts: Success count per IP
-        failure_counts: Failure count per IP
+        success_counts: Success count per IP (as bytes)
+        failure_counts: Failure count per IP (as bytes)
+
+    Returns:
+        tuple: (never_responded, always_responded, sometimes_responded) IP counts
     """
-    analysis_time = datetime.now()
+    # Format the timestamp once; it is shared by all three file headers
+    generated_on = datetime.now().isoformat(sep=' ', timespec='seconds')
 
     # Ensure output directory exists
     ensure_directories()
 
+    success_ips = success_counts.keys()
+    failure_ips = failure_counts.keys()
+
     # Never responded IPs
-    with open(ANALYSIS_NEVER_RESPONDED, 'w') as f:
-        f.write(f"# IPs that never responded (analysis generated on {analysis_time})\n")
-        f.write(f"# Total IPs: {len(never_responded)}\n")
-        f.write("# Format: IP_ADDRESS\tFAILED_COUNT\n\n")
-        for ip in sorted(never_responded):
-            failures = failure_counts.get(ip, 0)
-            f.write(f"{ip}\t{failures}\n")
+    ips = sorted(failure_ips - success_ips)
+    never_count = len(ips)
+    lines = chain(
+        [_HEADER_FMT.format("never responded", generated_on, never_count, "IP_ADDRESS\tFAILED_COUNT").encode()],
+        (b"%s\t%d\n" % (ip, failure_counts[ip]) for ip in ips)
+    )
+    _write_analysis_file(ANALYSIS_NEVER_RESPONDED, lines)
 
     # Always responded IPs
-    with open(ANALYSIS_ALWAYS_RESPONDED, 'w') as f:
-        f.write(f"# IPs that always responded (analysis generated on {analysis_time})\n")
-        f.write(f"# Total IPs: {len(always_responded)}\n")
-        f.write("# Format: IP_ADDRESS\tSUCCESS_COUNT\n\n")
-        for ip in sorted(always_responded):
-            successes = success_counts.get(ip, 0)
-            f.write(f"{ip}\t{successes}\n")
+    ips = sorted(success_ips - failure_ips)
+    always_count = len(ips)
+    lines = chain(
+        [_HEADER_FMT.format("always responded", generated_on, always_count, "IP_ADDRESS\tSUCCESS_COUNT").encode()],
+        (b"%s\t%d\n" % (ip, success_counts[ip]) for ip in ips)
+    )
+    _write_analysis_file(ANALYSIS_ALWAYS_RESPONDED, lines)
 
     # Sometimes responded IPs
-    with open(ANALYSIS_SOMETIMES_RESPONDED, 'w') as f:
-        f.write(f"# IPs that sometimes responded (analysis generated on {analysis_time})\n")
-        f.write(f"# Total IPs: {len(sometimes_responded)}\n")
-        f.write("# Format: IP_ADDRESS\tSUCCESS_COUNT\tFAILED_COUNT\tSUCCESS_RATE\n\n")
-        for ip in sorted(sometimes_responded):
-            successes = success_counts.get(ip, 0)
-            failures = failure_counts.get(ip, 0)
-            total = successes + failures
-            success_rate = (successes / total * 100) if total > 0 else 0
-            f.write(f"{ip}\t{successes}\t{failures}\t{success_rate:.1f}%\n")
+    ips = sorted(success_ips & failure_ips)
+    sometimes_count = len(ips)
+    lines = chain(
+        [_HEADER_FMT.format("sometimes responded", generated_on, sometimes_count,
+                            "IP_ADDRESS\tSUCCESS_COUNT\tFAILED_COUNT\tSUCCESS_RATE").encode()],
+        (_rate_line(ip, success_counts[ip], failure_counts[ip]) for ip in ips)
+    )
+    _write_analysis_file(ANALYSIS_SOMETIMES_RESPONDED, lines)
 
     print(f"Analysis files updated:")
-    print(f"  - analysis_never_responded.txt ({len(never_responded)} IPs)")
-    print(f"  - analysis_always_responded.txt ({len(always_responded)} IPs)")
-    print(f"  - analysis_sometimes_responded.txt ({len(sometimes_responded)} IPs)")
+    print(f"  - analysis_never_responded.txt ({never_count} IPs)")
+    print(f"  - analysis_always_responded.txt ({always_count} IPs)")
+    print(f"  - analysis_sometimes_responded.txt ({sometimes_count} IPs)")
+
+    return never_count, always_count, sometimes_count
 
 
 def main() -> None:
@@ -172,24 +231,16 @@ def main() -> None:
         print("No log data found. Run some ping tests first.")
         return
 
-    # Categorize IPs
-    never_responded, always_responded, sometimes_responded = categorize_ips(success_counts, failure_counts)
+    # Categorize IPs and write analysis files
+    never_count, always_count, sometimes_count = write_analysis_files(success_counts, failure_counts)
 
     # Print summary
-    total_ips = len(never_responded) + len(always_responded) + len(sometimes_responded)
+    total_ips = never_count + always_count + sometimes_count
     print(f"\nAnalysis Summary:")
     print(f"  Total unique IPs tested: {total_ips}")
-    print(f"  Never responded: {len(never_responded)} IPs")
-    print(f"  Always responded: {len(always_responded)} IPs")
-    print(f"  Sometimes responded: {len(sometimes_responded)} IPs")
-
-    if total_ips == 0:
-        print("No valid IP data found in log files.")
-        return
-
-    # Write analysis files
-    write_analysis_files(never_responded, always_responded, sometimes_responded,
-                        success_counts, failure_counts)
+    print(f"  Never responded: {never_count} IPs")
+    print(f"  Always responded: {always_count} IPs")
+    print(f"  Sometimes responded: {sometimes_count} IPs")
 
     print(f"\nAnalysis complete!")
 
@@ -5,17 +5,53 @@ Optional PostgreSQL integration for storing ping results.
 Falls back gracefully if database is not configured or dependencies are missing.
 """
 
+import atexit
+import io
 import logging
-import ipaddress
+import queue
+import re
+import socket
+import threading
+import time
+import weakref
+from concurrent.futures import Future
+from contextlib import contextmanager
 from datetime import datetime
-from typing import Optional, List, Tuple
+from typing import Iterable, Optional, List, Tuple
 from constants import (
     DATABASE_ENABLED, DATABASE_URL, DB_HOST, DB_PORT,
-    DB_NAME, DB_USER, DB_PASSWORD, DB_SCHEMA, LOGS_DIR
+    DB_NAME, DB_USER, DB_PASSWORD, DB_SCHEMA, LOGS_DIR,
+    DEFAULT_DATABASE_COPY_THRESHOLD, DEFAULT_DATABASE_POOL_SIZE,
+    DEFAULT_DATABASE_WRITER_MAX_ROWS, DEFAULT_DATABASE_WRITER_INTERVAL,
+    DEFAULT_DATABASE_WRITER_QUEUE_SIZE
 )
 
-# Global connection object
-_connection = None
+# Global connection pool, created lazily on first use
+_pool = None
+_pool_lock = threading.Lock()
+
+# Bounded queue and background thread for asynchronous result saving
+_write_queue = queue.Queue(maxsize=DEFAULT_DATABASE_WRITER_QUEUE_SIZE)
+_writer_thread = None
+_writer_lock = threading.Lock()
+
+# Dotted-quad shape; such strings are validated as IPv4, everything else as IPv6
+_IPV4_RE = re.compile(r'^\d{1,3}(?:\.\d{1,3}){3}$')
+
+# Canonical IPv4 literal (no leading zeros, octets 0-255), matched one per line
+_IPV4_OCTET = r'(?:25[0-5]|2[0-4]\d|1\d\d|[1-9]?\d)'
+_IPV4_LINE_RE = re.compile(rf'^(?:{_IPV4_OCTET}\.){{3}}{_IPV4_OCTET}$', re.MULTILINE)
+
+# Column order of rows written to ping_results
+PING_RESULT_COLUMNS = (
+    "ip_address, ping_time, success, response_time_ms, "
+    "job_name, label, timeout_seconds, ping_count"
+)
+
+# Server-side prepared INSERT for small batches, prepared once per connection;
+# connections drop out of the set when they are closed and garbage collected
+PING_INSERT_STATEMENT_NAME = "insert_ping_results"
+_prepared_connections = weakref.WeakSet()
 
 def get_table_name(table_name: str) -> str:
     """
@@ -31,56 +67,118 @@ def get_table_name(table_name: str) -> str:
         return f"{DB_SCHEMA}.{table_name}"
     return table_name
 
-def get_database_connection():
+def _get_connection_pool():
     """
-    Get database connection if configured and available.
+    Get the database connection pool, creating it on first use.
+
+    The ping_results table is created when the pool is first set up. Creation
+    is locked so daemon jobs starting together share a single pool.
 
     Returns:
-        psycopg2.connection or None: Database connection or None if not available
+        psycopg2.pool.ThreadedConnectionPool: Connection pool
+
+    Raises:
+        ImportError: If psycopg2 is not installed
+        Exception: If the database cannot be reached
     """
-    global _connection
+    global _pool
 
-    if not DATABASE_ENABLED:
-        return None
+    if _pool is not None:
+        return _pool
 
-    if _connection is not None:
-        try:
-            # Test if connection is still alive
-            _connection.execute('SELECT 1')
-            return _connection
-        except:
-            _connection = None
+    with _pool_lock:
+        if _pool is None:
+            _pool = _create_connection_pool()
+    return _pool
+
+def _create_connection_pool():
+    """
+    Create the database connection pool and ensure the ping_results table exists.
+
+    Returns:
+        psycopg2.pool.ThreadedConnectionPool: Connection pool
 
+    Raises:
+        ImportError: If psycopg2 is not installed
+        Exception: If the database cannot be reached
+    """
+    from psycopg2.pool import ThreadedConnectionPool
+
+    # Plain tuple cursors by default; only get_ping_statistics asks for dict rows
+    if DATABASE_URL:
+        pool = ThreadedConnectionPool(1, DEFAULT_DATABASE_POOL_SIZE, DATABASE_URL)
+    else:
+        pool = ThreadedConnectionPool(
+            1, DEFAULT_DATABASE_POOL_SIZE,
+            host=DB_HOST,
+            port=DB_PORT,
+            database=DB_NAME,
+            user=DB_USER,
+            password=DB_PASSWORD
+        )
+
+    # Ensure table exists
+    connection = pool.getconn()
     try:
-        import psycopg2
-        from psycopg2.extras import RealDictCursor
+        create_table_if_not_exists(connection)
+        connection.commit()
+    except Exception:
+        pool.putconn(connection)
+        pool.closeall()
+        raise
+    pool.putconn(connection)
+    return pool
 
-        if DATABASE_URL:
-            _connection = psycopg2.connect(DATABASE_URL, cursor_factory=RealDictCursor)
-        else:
-            _connection = psycopg2.connect(
-                host=DB_HOST,
-                port=DB_PORT,
-                database=DB_NAME,
-                user=DB_USER,
-                password=DB_PASSWORD,
-                cursor_factory=RealDictCursor
-            )
+def _acquire_connection():
+    """
+    Take a connection from the pool.
 
-        # Auto-commit for simplicity
-        _connection.autocommit = True
+    No round trip is made to check liveness; connections psycopg2 already
+    knows are closed are replaced, and writers retry once if a pooled
+    connection turns out to be dead when used.
+
+    Returns:
+        tuple: (pool, connection), or (None, None) if not available
+    """
+    try:
+        pool = _get_connection_pool()
+        connection = pool.getconn()
 
-        # Ensure table exists
-        create_table_if_not_exists(_connection)
+        if connection.closed:
+            # Connection is broken; discard it and take a fresh one
+            pool.putconn(connection, close=True)
+            connection = pool.getconn()
 
-        return _connection
+        return pool, connection
 
     except ImportError:
         logging.warning("psycopg2 not installed. Database logging disabled. Install with: pip install psycopg2-binary")
-        return None
+        return None, None
     except Exception as e:
         logging.warning(f"Database connection failed: {e}. Continuing with file logging only.")
-        return None
+        return None, None
+
+@contextmanager
+def get_database_connection():
+    """
+    Borrow a database connection from the pool if configured and available.
+
+    The connection is returned to the pool when the block exits, so several
+    threads can write results concurrently. Connections are not in autocommit
+    mode; writers commit once per batch and the pool rolls back anything left
+    uncommitted when the connection is returned.
+
+    Yields:
+        psycopg2.connection or None: Database connection or None if not available
+    """
+    # Return the connection to the pool it came from, even if the global pool
+    # is closed and replaced meanwhile
+    pool, connection = _acquire_connection() if DATABASE_ENABLED else (None, None)
+    try:
+        yield connection
+    finally:
+        if connection is not None:
+            pool.putconn(connection)
 
 def create_table_if_not_exists(connection):
     """
@@ -112,11 +210,19 @@ def create_table_if_not_exists(connection):
                 );
 
                 -- Create indexes for common queries
-                CREATE INDEX IF NOT EXISTS idx_ping_results_ping_time ON {table_name}(ping_time);
                 CREATE INDEX IF NOT EXISTS idx_ping_results_ip_address ON {table_name}(ip_address);
-                CREATE INDEX IF NOT EXISTS idx_ping_results_success ON {table_name}(success);
                 CREATE INDEX IF NOT EXISTS idx_ping_results_job_name ON {table_name}(job_name);
                 CREATE INDEX IF NOT EXISTS idx_ping_results_label ON {table_name}(label);
+
+                -- Covering index for get_ping_statistics: the time-range filter,
+                -- per-IP grouping and success counts are served by an index-only scan
+                CREATE INDEX IF NOT EXISTS idx_ping_results_time_ip_success
+                    ON {table_name}(ping_time, ip_address, success);
+
+                -- A boolean-only index is too unselective to be used, and the
+                -- covering index above also serves ping_time lookups; both only slow inserts
+                DROP INDEX IF EXISTS {get_table_name("idx_ping_results_success")};
+                DROP INDEX IF EXISTS {get_table_name("idx_ping_results_ping_time")};
             """)
             logging.info("Database table ping_results ready")
     except Exception as e:
@@ -127,16 +233,22 @@ def is_valid_ip(ip_string: str) -> bool:
     """
     Validate if a string is a valid IP address.
 
+    Uses socket.inet_pton (a C call) instead of ipaddress.ip_address, so no
+    address object is allocated per check. A cheap regex picks the address
+    family first.
+
     Args:
         ip_string: String to validate as IP address
 
     Returns:
         bool: True if valid IP address, False otherwise
     """
+    ip_string = ip_string.strip()
+    family = socket.AF_INET if _IPV4_RE.match(ip_string) else socket.AF_INET6
     try:
-        ipaddress.ip_address(ip_string.strip())
+        socket.inet_pton(family, ip_string)
         return True
-    except ValueError:
+    except (OSError, ValueError):
         return False
 
 def log_invalid_ips(invalid_ips: List[str], job_name: str = None) -> None:
@@ -168,6 +280,115 @@ def log_invalid_ips(invalid_ips: List[str], job_name: str = None) -> None:
     except Exception as e:
         logging.error(f"Failed to write invalid IPs log: {e}")
 
+def get_ping_prepare_statement(table_name: str) -> str:
+    """
+    Get the PREPARE statement for the array INSERT of ping results.
+
+    Each column is passed as one array parameter and unnested server-side, so
+    the statement is the same whatever the batch size and is parsed and
+    planned once per connection.
+
+    Args:
+        table_name: Schema-qualified ping_results table name
+
+    Returns:
+        str: PREPARE ... AS INSERT ... SELECT FROM unnest(...) statement
+    """
+    return (
+        f"PREPARE {PING_INSERT_STATEMENT_NAME} "
+        "(inet[], timestamptz[], boolean[], float8[], varchar[], varchar[], integer[], integer[]) "
+        f"AS INSERT INTO {table_name} ({PING_RESULT_COLUMNS}) "
+        "SELECT * FROM unnest($1, $2, $3, $4, $5, $6, $7, $8)"
+    )
+
+def get_ping_execute_statement() -> str:
+    """
+    Get the EXECUTE statement for the prepared ping results INSERT.
+
+    Returns:
+        str: EXECUTE statement with one array placeholder per column
+    """
+    return (
+        f"EXECUTE {PING_INSERT_STATEMENT_NAME} (%s::inet[], %s::timestamptz[], %s::boolean[], "
+        "%s::float8[], %s::varchar[], %s::varchar[], %s::integer[], %s::integer[])"
+    )
+
+def get_ping_copy_statement(table_name: str) -> str:
+    """
+    Get the COPY FROM STDIN statement for ping results.
+
+    Args:
+        table_name: Schema-qualified ping_results table name
+
+    Returns:
+        str: COPY statement in text format
+    """
+    return f"COPY {table_name} ({PING_RESULT_COLUMNS}) FROM STDIN WITH (FORMAT text)"
+
+def _copy_value(value) -> str:
+    """
+    Format a value for PostgreSQL COPY text format.
+
+    Args:
+        value: Python value to format
+
+    Returns:
+        str: Escaped field value (\\N for NULL)
+    """
+    if value is None:
+        return '\\N'
+    if isinstance(value, bool):
+        return 't' if value else 'f'
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return (str(value).replace('\\', '\\\\').replace('\t', '\\t')
+            .replace('\n', '\\n').replace('\r', '\\r'))
+
+def copy_ping_rows(cursor, table_name: str, rows: List[tuple]) -> None:
+    """
+    Bulk load ping result rows with COPY FROM STDIN.
+
+    Args:
+        cursor: Database cursor
+        table_name: Schema-qualified ping_results table name
+        rows: Row tuples in PING_RESULT_COLUMNS order
+    """
+    buffer = io.StringIO()
+    for row in rows:
+        buffer.write('\t'.join(_copy_value(value) for value in row))
+        buffer.write('\n')
+    buffer.seek(0)
+
+    cursor.copy_expert(get_ping_copy_statement(table_name), buffer)
+
+def write_ping_rows(connection, table_name: str, rows: List[tuple]) -> None:
+    """
+    Write ping result rows and commit them as one transaction.
+
+    Batches of DEFAULT_DATABASE_COPY_THRESHOLD rows or more are loaded with
+    COPY; smaller ones execute the prepared INSERT of unnested column arrays,
+    preparing it first if this connection has not yet done so.
+
+    Args:
+        connection: Database connection
+        table_name: Schema-qualified ping_results table name
+        rows: Row tuples in PING_RESULT_COLUMNS order
+    """
+    # Write the whole batch in one transaction (one WAL flush per batch)
+    with connection.cursor() as cursor:
+        if len(rows) >= DEFAULT_DATABASE_COPY_THRESHOLD:
+            copy_ping_rows(cursor, table_name, rows)
+        else:
+            if connection not in _prepared_connections:
+                # Prepared statements outlive the transaction, so this is done once
+                cursor.execute(get_ping_prepare_statement(table_name))
+                _prepared_connections.add(connection)
+
+            # Transpose rows into per-column lists; psycopg2 adapts lists to arrays
+            columns = [list(column) for column in zip(*rows)]
+            cursor.execute(get_ping_execute_statement(), columns)
+    connection.commit()
+
 def save_ping_results(results: List[Tuple[str, bool, str, Optional[str]]], job_name: str = None,
                      timeout: int = None, count: int = None) -> bool:
     """
@@ -182,53 +403,193 @@ def save_ping_results(results: List[Tuple[str, bool, str, Optional[str]]], job_n
     Returns:
         bool: True if saved to database, False if skipped/failed
     """
-    connection = get_database_connection()
-    if not connection:
-        return False
+    with get_database_connection() as connection:
+        if not connection:
+            return False
+
+        try:
+            timestamp = datetime.now()
+            table_name = get_table_name("ping_results")
+
+            # Filter results to separate valid and invalid IPs
+            valid_results = []
+            invalid_ips = []
+
+            # Match all IPv4 literals in one regex pass; only the rest (IPv6,
+            # padded or malformed strings) go through is_valid_ip one by one
+            ipv4_ips = set(_IPV4_LINE_RE.findall('\n'.join(result[0] for result in results)))
+            valid_ip = is_valid_ip
+            for ip_address, success, response_time, label in results:
+                if ip_address in ipv4_ips or valid_ip(ip_address):
+                    valid_results.append((ip_address, success, response_time, label))
+                else:
+                    invalid_ips.append(ip_address)
+
+            # Log invalid IPs if any found
+            if invalid_ips:
+                log_invalid_ips(invalid_ips, job_name)
+
+            # Only proceed with valid IPs
+            if not valid_results:
+                logging.warning("No valid IP addresses to save to database")
+                return len(invalid_ips) == 0  # Return True only if there were no invalid IPs
+
+            import psycopg2
+
+            # Successful pings carry a float RTT (or None); failed pings carry an
+            # error string, stored as NULL in response_time_ms
+            rows = [
+                (ip_address, timestamp, success, response_time if success else None,
+                 job_name, label, timeout, count)
+                for ip_address, success, response_time, label in valid_results
+            ]
+
+            try:
+                write_ping_rows(connection, table_name, rows)
+            except psycopg2.OperationalError:
+                # Pooled connection was dropped by the server; retry once on a fresh one
+                with get_database_connection() as retry_connection:
+                    if not retry_connection:
+                        raise
+                    write_ping_rows(retry_connection, table_name, rows)
+
+            if invalid_ips:
+                logging.info(f"Saved {len(valid_results)} valid ping results to database ({len(invalid_ips)} invalid IPs filtered)")
+            else:
+                logging.info(f"Saved {len(valid_results)} ping results to database")
+            return True
+
+        except Exception as e:
+            logging.error(f"Failed to save ping results to database: {e}")
+            try:
+                connection.rollback()
+            except Exception:
+                pass
+            return False
+
+def _writer_loop() -> None:
+    """
+    Drain the write queue and save queued results in batches.
+
+    Runs in the background writer thread. Waits for the first queued batch,
+    then keeps collecting for up to DEFAULT_DATABASE_WRITER_INTERVAL seconds or
+    DEFAULT_DATABASE_WRITER_MAX_ROWS rows, and saves everything collected with
+    one save_ping_results call per (job_name, timeout, count) combination, and
+    resolves each queued batch's future with the outcome of its save.
+    """
+    while True:
+        items = [_write_queue.get()]
+        row_count = len(items[0][0])
+        deadline = time.monotonic() + DEFAULT_DATABASE_WRITER_INTERVAL
+
+        while row_count < DEFAULT_DATABASE_WRITER_MAX_ROWS:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                item = _write_queue.get(timeout=remaining)
+            except queue.Empty:
+                break
+            items.append(item)
+            row_count += len(item[0])
+
+        try:
+            grouped = {}
+            for results, job_name, timeout, count, future in items:
+                group = grouped.setdefault((job_name, timeout, count), ([], []))
+                group[0].extend(results)
+                group[1].append(future)
+
+            for (job_name, timeout, count), (results, futures) in grouped.items():
+                saved = save_ping_results(results, job_name=job_name, timeout=timeout, count=count)
+                for future in futures:
+                    future.set_result(saved)
+        except Exception as e:
+            logging.error(f"Background database writer error: {e}")
+        finally:
+            for item in items:
+                future = item[4]
+                if not future.done():
+                    future.set_result(False)
+                _write_queue.task_done()
+
+def save_ping_results_async(results: List[Tuple[str, bool, str, Optional[str]]], job_name: str = None,
+                            timeout: int = None, count: int = None, block: bool = True) -> Optional[Future]:
+    """
+    Queue ping results to be saved by the background writer thread.
+
+    The writer batches queued results into larger database writes. Pass the
+    returned futures to wait_for_saves() to wait until this caller's results
+    are saved, without waiting on other callers.
+
+    At most DEFAULT_DATABASE_WRITER_QUEUE_SIZE batches wait for the writer.
+    When the queue is full this blocks until there is room, or with
+    block=False returns None at once without queueing the results; callers in
+    the middle of pinging use that to hold the batch and queue it later.
+
+    Args:
+        results: List of (ip_address, success, response_time, label) tuples
+        job_name: Optional job name for tracking
+        timeout: Ping timeout used
+        count: Ping count used
+        block: Whether to wait for room in a full queue
+
+    Returns:
+        Future or None: Resolves to True once the results are saved, False if
+        the save failed; None if block is False and the queue is full
+    """
+    global _writer_thread
 
+    with _writer_lock:
+        if _writer_thread is None:
+            _writer_thread = threading.Thread(target=_writer_loop, name="db-writer", daemon=True)
+            _writer_thread.start()
+
+    future = Future()
     try:
-        timestamp = datetime.now()
-        table_name = get_table_name("ping_results")
+        _write_queue.put((list(results), job_name, timeout, count, future), block=block)
+    except queue.Full:
+        return None
+    return future
 
-        # Filter results to separate valid and invalid IPs
-        valid_results = []
-        invalid_ips = []
+def wait_for_saves(futures: Iterable[Future]) -> bool:
+    """
+    Block until the given save_ping_results_async batches are saved.
 
-        for ip_address, success, response_time, label in results:
-            if is_valid_ip(ip_address):
-                valid_results.append((ip_address, success, response_time, label))
-            else:
-                invalid_ips.append(ip_address)
+    Args:
+        futures: Futures returned by save_ping_results_async
 
-        # Log invalid IPs if any found
-        if invalid_ips:
-            log_invalid_ips(invalid_ips, job_name)
+    Returns:
+        bool: True if every batch was saved
+    """
+    return all([future.result() for future in futures])
 
-        # Only proceed with valid IPs
-        if not valid_results:
-            logging.warning("No valid IP addresses to save to database")
-            return len(invalid_ips) == 0  # Return True only if there were no invalid IPs
+def close_connection_pool() -> None:
+    """
+    Close all pooled database connections.
 
-        with connection.cursor() as cursor:
-            for ip_address, success, response_time, label in valid_results:
-                # For failed pings, store NULL instead of error strings in response_time_ms
-                response_time_value = response_time if success and isinstance(response_time, (int, float)) else None
+    Registered with atexit ahead of flush_ping_results so that queued
+    results are written before the pool goes away.
+    """
+    global _pool
 
-                cursor.execute(f"""
-                    INSERT INTO {table_name}
-                    (ip_address, ping_time, success, response_time_ms, job_name, label, timeout_seconds, ping_count)
-                    VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
-                """, (ip_address, timestamp, success, response_time_value, job_name, label, timeout, count))
+    with _pool_lock:
+        if _pool is not None:
+            _pool.closeall()
+            _pool = None
 
-        if invalid_ips:
-            logging.info(f"Saved {len(valid_results)} valid ping results to database ({len(invalid_ips)} invalid IPs filtered)")
-        else:
-            logging.info(f"Saved {len(valid_results)} ping results to database")
-        return True
+def flush_ping_results() -> None:
+    """
+    Block until all results queued with save_ping_results_async are saved.
 
-    except Exception as e:
-        logging.error(f"Failed to save ping results to database: {e}")
-        return False
+    Registered with atexit so queued results are not lost on shutdown.
+    """
+    if _writer_thread is not None:
+        _write_queue.join()
+
+# atexit runs handlers in reverse order: flush first, then close the pool
+atexit.register(close_connection_pool)
+atexit.register(flush_ping_results)
 
 def get_ping_statistics(ip_address: str = None, hours: int = 24) -> Optional[dict]:
     """
@@ -241,43 +602,45 @@ def get_ping_statistics(ip_address: str = None, hours: int = 24) -> Optional[dic
     Returns:
         dict: Statistics or None if database not available
     """
-    connection = get_database_connection()
-    if not connection:
-        return None
+    with get_database_connection() as connection:
+        if not connection:
+            return None
 
-    try:
-        table_name = get_table_name("ping_results")
+        try:
+            from psycopg2.extras import RealDictCursor
 
-        with connection.cursor() as cursor:
-            where_clause = "WHERE ping_time >= NOW() - INTERVAL '%s hours'" % hours
-            if ip_address:
-                where_clause += " AND ip_address = %s"
-                params = (ip_address,)
-            else:
-                params = ()
+            table_name = get_table_name("ping_results")
 
-            cursor.execute(f"""
-                SELECT
-                    ip_address,
-                    COUNT(*) as total_pings,
-                    COUNT(*) FILTER (WHERE success = true) as successful_pings,
-                    COUNT(*) FILTER (WHERE success = false) as failed_pings,
-                    ROUND(
-                        (COUNT(*) FILTER (WHERE success = true) * 100.0 / COUNT(*)), 2
-                    ) as success_rate,
-                    MIN(ping_time) as first_ping,
-                    MAX(ping_time) as last_ping
-                FROM {table_name}
-                {where_clause}
-                GROUP BY ip_address
-                ORDER BY ip_address
-            """, params)
-
-            return cursor.fetchall()
+            with connection.cursor(cursor_factory=RealDictCursor) as cursor:
+                # Bind hours as a parameter so the statement text is constant
+                where_clause = "WHERE ping_time >= NOW() - %s * INTERVAL '1 hour'"
+                params = (hours,)
+                if ip_address:
+                    where_clause += " AND ip_address = %s"
+                    params += (ip_address,)
 
-    except Exception as e:
-        logging.error(f"Failed to get ping statistics: {e}")
-        return None
+                cursor.execute(f"""
+                    SELECT
+                        ip_address,
+                        COUNT(*) as total_pings,
+                        COUNT(*) FILTER (WHERE success = true) as successful_pings,
+                        COUNT(*) FILTER (WHERE success = false) as failed_pings,
+                        ROUND(
+                            (COUNT(*) FILTER (WHERE success = true) * 100.0 / COUNT(*)), 2
+                        ) as success_rate,
+                        MIN(ping_time) as first_ping,
+                        MAX(ping_time) as last_ping
+                    FROM {table_name}
+                    {where_clause}
+                    GROUP BY ip_address
+                    ORDER BY ip_address
+                """, params)
+
+                return cursor.fetchall()
+
+        except Exception as e:
+            logging.error(f"Failed to get ping statistics: {e}")
+            return None
 
 def is_database_enabled() -> bool:
     """
@@ -292,10 +655,10 @@ def is_database_enabled() -> bool:
         logging.debug("Database disabled: No environment variables configured")
         return False
 
-    connection = get_database_connection()
-    if connection is None:
-        logging.warning("Database enabled in config but connection failed")
-        return False
+    with get_database_connection() as connection:
+        if connection is None:
+            logging.warning("Database enabled in config but connection failed")
+            return False
 
     logging.debug("Database connection successful")
     return True
\ No newline at end of file
@@ -0,0 +1,370 @@
+"""
+Batched ICMP echo module for ping checker
+
+Pings many hosts from a single thread over one ICMP socket per address family.
+All echo requests are multiplexed with a selector and replies are matched back
+to their host by (source address, sequence number).
+
+Unprivileged ICMP datagram sockets are used when permitted (on Linux the user's
+group must be in net.ipv4.ping_group_range); otherwise raw ICMP sockets are
+used when the process has CAP_NET_RAW, with a BPF filter so the kernel only
+delivers our own echo replies. Hosts whose address family has neither are left
+to the system ping fallback in ping_checker.
+"""
+
+import ctypes
+import heapq
+import itertools
+import logging
+import os
+import selectors
+import socket
+import struct
+import sys
+import time
+from functools import lru_cache
+from typing import FrozenSet, Iterable, Iterator, Optional, Tuple, Union
+from constants import DEFAULT_PING_TIMEOUT, DEFAULT_PING_COUNT, DEFAULT_WORKER_COUNT, DEFAULT_PING_INTERVAL
+
+# Echo request/reply ICMP types per address family
+_ECHO_TYPES = {
+    socket.AF_INET: (8, 0),
+    socket.AF_INET6: (128, 129),
+}
+_ICMP_PROTOCOLS = {
+    socket.AF_INET: socket.IPPROTO_ICMP,
+    socket.AF_INET6: socket.IPPROTO_ICMPV6,
+}
+
+# ICMP echo header: type, code, checksum, identifier, sequence number
+_ECHO_HEADER = struct.Struct('!BBHHH')
+
+# Same payload size as the system ping command
+_PAYLOAD = bytes(56)
+
+# Sequence numbers are 16-bit and must be unique among outstanding requests
+_MAX_OUTSTANDING = 0xFFFF
+
+# ICMP identifiers for raw sockets: one per batch_ping call, starting from the PID
+# so concurrent processes and concurrent jobs in one process don't share one
+_IDENTS = itertools.count(os.getpid())
+
+# Datagram socket semantics and BPF socket filters below are Linux-specific
+_IS_LINUX = sys.platform.startswith('linux')
+
+# Linux datagram ICMP sockets get the kernel's identifier and only receive their
+# own replies; elsewhere (e.g. macOS) the identifier is ours and must be checked
+_KERNEL_SETS_IDENT = _IS_LINUX
+
+# Linux SOL_SOCKET option to attach a classic BPF program (not exported by the socket module)
+_SO_ATTACH_FILTER = getattr(socket, 'SO_ATTACH_FILTER', 26)
+
+# Classic BPF opcodes used by _attach_ident_filter
+_BPF_LDX_B_MSH = 0xb1   # X = 4 * (P[k] & 0xf), the IPv4 header length
+_BPF_LD_B_IND = 0x50    # A = P[X + k] (byte)
+_BPF_LD_H_IND = 0x48    # A = P[X + k] (half word)
+_BPF_JEQ_K = 0x15       # if A == k jump jt else jump jf
+_BPF_RET_K = 0x06       # accept k bytes (0 drops the packet)
+
+
+class _EchoTarget:
+    """Per-host state while a host is being pinged."""
+
+    __slots__ = ('ip_address', 'label', 'family', 'address', 'sent', 'rtts', 'sequences', 'done')
+
+    def __init__(self, ip_address: str, label: Optional[str], family: int, address: str):
+        self.ip_address = ip_address
+        self.label = label
+        self.family = family
+        self.address = address  # Normalized form, as reported by recvfrom
+        self.sent = 0
+        self.rtts = []
+        self.sequences = []
+        self.done = False
+
+
+def address_family(ip_address: str) -> Optional[Tuple[int, str]]:
+    """
+    Get the address family and normalized form of an IP address literal.
+
+    Args:
+        ip_address: IP address string
+
+    Returns:
+        tuple or None: (family, normalized_address), or None if not an IP literal
+    """
+    for family in (socket.AF_INET, socket.AF_INET6):
+        try:
+            return family, socket.inet_ntop(family, socket.inet_pton(family, ip_address.strip()))
+        except (OSError, ValueError):
+            continue
+    return None
+
+
+def _open_socket(family: int) -> Tuple[socket.socket, bool]:
+    """
+    Open a non-blocking ICMP socket, preferring an unprivileged datagram socket.
+
+    Args:
+        family: socket.AF_INET or socket.AF_INET6
+
+    Returns:
+        tuple: (socket, is_raw)
+
+    Raises:
+        OSError: If neither datagram nor raw ICMP sockets are permitted for this family
+    """
+    try:
+        sock, raw = socket.socket(family, socket.SOCK_DGRAM, _ICMP_PROTOCOLS[family]), False
+    except PermissionError:
+        sock, raw = socket.socket(family, socket.SOCK_RAW, _ICMP_PROTOCOLS[family]), True
+    sock.setblocking(False)
+    return sock, raw
+
+
+def _attach_ident_filter(sock: socket.socket, ident: int) -> None:
+    """
+    Attach a BPF filter to a raw IPv4 ICMP socket that accepts only echo replies with our identifier.
+
+    Without it the kernel copies every ICMP packet received by the host into
+    this socket. Classic BPF socket filters and the sock_fprog layout used
+    here are Linux-only, so elsewhere nothing is attached. Failure is not
+    fatal; replies are also checked in user space.
+
+    Args:
+        sock: Raw AF_INET ICMP socket
+        ident: ICMP identifier used in our echo requests
+    """
+    program = [
+        (_BPF_LDX_B_MSH, 0, 0, 0),       # X = IP header length
+        (_BPF_LD_B_IND, 0, 0, 0),        # A = ICMP type
+        (_BPF_JEQ_K, 0, 3, 0),           # echo reply? else drop
+        (_BPF_LD_H_IND, 0, 0, 4),        # A = ICMP identifier
+        (_BPF_JEQ_K, 0, 1, ident),       # ours? else drop
+        (_BPF_RET_K, 0, 0, 0xFFFFFFFF),  # accept
+        (_BPF_RET_K, 0, 0, 0),           # drop
+    ]
+    instructions = ctypes.create_string_buffer(b''.join(struct.pack('HBBI', *insn) for insn in program))
+    fprog = struct.pack('HL', len(program), ctypes.addressof(instructions))
+    try:
+        sock.setsockopt(socket.SOL_SOCKET, _SO_ATTACH_FILTER, fprog)
+    except OSError as e:
+        logging.debug(f"Could not attach ICMP BPF filter: {e}")
+
+
+@lru_cache(maxsize=None)
+def available_families() -> FrozenSet[int]:
+    """
+    Get the address families that can be pinged with datagram or raw ICMP sockets.
+
+    Checked once per process.
+
+    Returns:
+        frozenset: Usable address families
+    """
+    families = set()
+    for family in _ECHO_TYPES:
+        try:
+            _open_socket(family)[0].close()
+            families.add(family)
+        except OSError as e:
+            name = 'IPv4' if family == socket.AF_INET else 'IPv6'
+            logging.warning(f"{name} ICMP sockets unavailable ({e}); using system ping for {name} hosts")
+    return frozenset(families)
+
+
+def _checksum(data: bytes) -> int:
+    """
+    Compute the Internet checksum (RFC 1071) of an ICMP message.
+
+    Args:
+        data: ICMP message with a zero checksum field
+
+    Returns:
+        int: 16-bit checksum
+    """
+    if len(data) % 2:
+        data += b'\x00'
+    total = sum(struct.unpack(f'!{len(data) // 2}H', data))
+    total = (total >> 16) + (total & 0xFFFF)
+    total += total >> 16
+    return ~total & 0xFFFF
+
+
+def _echo_request(family: int, ident: int, sequence: int) -> bytes:
+    """
+    Build an ICMP echo request.
+
+    On Linux the kernel rewrites the identifier of datagram ICMP sockets. The
+    kernel fills in the ICMPv6 checksum; the IPv4 checksum is computed here.
+
+    Args:
+        family: socket.AF_INET or socket.AF_INET6
+        ident: ICMP identifier
+        sequence: ICMP sequence number
+
+    Returns:
+        bytes: Echo request message
+    """
+    request_type = _ECHO_TYPES[family][0]
+    message = _ECHO_HEADER.pack(request_type, 0, 0, ident, sequence) + _PAYLOAD
+    if family == socket.AF_INET:
+        message = _ECHO_HEADER.pack(request_type, 0, _checksum(message), ident, sequence) + _PAYLOAD
+    return message
+
+
+def _result(target: _EchoTarget) -> Tuple[str, bool, Union[float, str, None], Optional[str]]:
+    """
+    Build the ping result for a finished host.
+
+    Args:
+        target: Finished host state
+
+    Returns:
+        tuple: (ip_address, success, response_time, label)
+    """
+    if target.rtts:
+        return (target.ip_address, True, sum(target.rtts) / len(target.rtts), target.label)
+    return (target.ip_address, False, "No response", target.label)
+
+
+def batch_ping(hosts: Iterable[Tuple[str, Optional[str]]], timeout: int = DEFAULT_PING_TIMEOUT,
+               count: int = DEFAULT_PING_COUNT, max_in_flight: int = DEFAULT_WORKER_COUNT,
+               interval: float = DEFAULT_PING_INTERVAL
+               ) -> Iterator[Tuple[str, bool, Union[float, str, None], Optional[str]]]:
+    """
+    Ping hosts over shared ICMP sockets, yielding each result as its host finishes.
+
+    A host finishes when all `count` replies arrived or `timeout` seconds passed
+    after its last request. It counts as reachable if any reply arrived within
+    `timeout` seconds of its request; the response time is the average round
+    trip in milliseconds. Finished hosts are yielded only after every ready
+    socket is drained, so time spent by the caller between results is never
+    counted in a round trip.
+
+    Args:
+        hosts: (ip_address, label) tuples; addresses must be IP literals of a
+               family in available_families()
+        timeout: Seconds to wait for a reply after the last request
+        count: Echo requests per host
+        max_in_flight: Maximum number of hosts being pinged at once
+        interval: Seconds between requests to the same host
+
+    Yields:
+        tuple: (ip_address, success, response_time, label)
+    """
+    max_in_flight = max(1, min(max_in_flight, _MAX_OUTSTANDING // max(count, 1)))
+    ident = next(_IDENTS) & 0xFFFF
+    pending = iter(hosts)
+    selector = selectors.DefaultSelector()
+    sockets = {}  # family -> socket
+    outstanding = {}  # sequence -> (target, send time)
+    timers = []  # heap of (due time, tie breaker, target)
+    order = itertools.count()
+    sequence = 0
+    in_flight = 0
+    exhausted = False
+
+    def finish(target):
+        nonlocal in_flight
+        target.done = True
+        in_flight -= 1
+        for seq in target.sequences:
+            outstanding.pop(seq, None)
+        return _result(target)
+
+    try:
+        while True:
+            now = time.monotonic()
+
+            # Start new hosts while there is room
+            while in_flight < max_in_flight and not exhausted:
+                item = next(pending, None)
+                if item is None:
+                    exhausted = True
+                    break
+                ip_address, label = item
+                family, address = address_family(ip_address)
+                if family not in sockets:
+                    sock, raw = _open_socket(family)
+                    if raw and family == socket.AF_INET and _IS_LINUX:
+                        _attach_ident_filter(sock, ident)
+                    sockets[family] = sock
+                    selector.register(sock, selectors.EVENT_READ, (family, raw))
+                in_flight += 1
+                heapq.heappush(timers, (now, next(order), _EchoTarget(ip_address, label, family, address)))
+
+            if exhausted and in_flight == 0:
+                return
+
+            # Results of this round, yielded once sends and receives are done
+            finished = []
+
+            # Send due requests and finish hosts whose deadline passed
+            while timers and timers[0][0] <= now:
+                _, _, target = heapq.heappop(timers)
+                if target.done:
+                    continue
+                if target.sent >= count:
+                    finished.append(finish(target))
+                    continue
+
+                while sequence in outstanding:
+                    sequence = (sequence + 1) & 0xFFFF
+                try:
+                    sockets[target.family].sendto(_echo_request(target.family, ident, sequence), (target.address, 0))
+                except OSError as e:
+                    finish(target)
+                    finished.append((target.ip_address, False, f"Error: {str(e)}", target.label))
+                    continue
+
+                outstanding[sequence] = (target, now)
+                target.sequences.append(sequence)
+                target.sent += 1
+                sequence = (sequence + 1) & 0xFFFF
+                due = now + (interval if target.sent < count else timeout)
+                heapq.heappush(timers, (due, next(order), target))
+
+            # Every host in flight has a pending timer; none left means all finished
+            ready = selector.select(max(0.0, timers[0][0] - time.monotonic())) if timers else []
+
+            # Drain every ready socket, timestamping replies as they are read
+            for key, _ in ready:
+                sock, (family, raw) = key.fileobj, key.data
+                reply_type = _ECHO_TYPES[family][1]
+                while True:
+                    try:
+                        data, sender = sock.recvfrom(2048)
+                    except BlockingIOError:
+                        break
+                    received = time.monotonic()
+
+                    # Raw IPv4 sockets, and datagram ones outside Linux, deliver the
+                    # IP header too; skip it (an echo reply never starts with 0x4_)
+                    offset = 0
+                    if family == socket.AF_INET and data and data[0] >> 4 == 4:
+                        offset = (data[0] & 0x0F) * 4
+                    if len(data) < offset + _ECHO_HEADER.size:
+                        continue
+                    icmp_type, _, _, reply_ident, seq = _ECHO_HEADER.unpack_from(data, offset)
+
+                    # Linux datagram sockets only see their own replies; others see all of them
+                    if (raw or not _KERNEL_SETS_IDENT) and reply_ident != ident:
+                        continue
+                    entry = outstanding.get(seq)
+                    if icmp_type != reply_type or entry is None or entry[0].address != sender[0]:
+                        continue
+
+                    target, sent_at = outstanding.pop(seq)
+                    rtt = (received - sent_at) * 1000
+                    if rtt > timeout * 1000:
+                        continue  # Too late (e.g. read after a slow caller); counts as lost
+                    target.rtts.append(rtt)
+                    if len(target.rtts) == count:
+                        finished.append(finish(target))
+
+            yield from finished
+    finally:
+        selector.close()
+        for sock in sockets.values():
+            sock.close()
@@ -5,70 +5,141 @@ Provides functionality to get IP addresses from database sources using
 configurable SQL queries stored in files.
 """
 
+import atexit
+import bisect
+import ipaddress
 import logging
-from typing import List, Optional, Tuple
+import socket
+import threading
+from contextlib import contextmanager
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Tuple
 from pathlib import Path
 from constants import (
     IP_SOURCE_DATABASE_ENABLED, IP_SOURCE_DATABASE_URL,
     IP_SOURCE_DB_HOST, IP_SOURCE_DB_PORT, IP_SOURCE_DB_NAME,
     IP_SOURCE_DB_USER, IP_SOURCE_DB_PASSWORD, IP_SOURCE_DB_SCHEMA,
-    IP_SOURCE_SQL_FILE, SQL_DIR
+    IP_SOURCE_SQL_FILE, IP_SOURCE_FETCH_SIZE, IP_EXCLUDE_CIDRS, SQL_DIR, DEFAULT_DATABASE_POOL_SIZE
 )
 
-# Global connection object for IP source database
-_ip_source_connection = None
+# Global connection pool for IP source database, created lazily on first use
+_ip_source_pool = None
+_ip_source_pool_lock = threading.Lock()
 
-def get_ip_source_connection():
+def _get_ip_source_pool():
     """
-    Get IP source database connection if configured and available.
+    Get the IP source connection pool, creating it on first use.
+
+    Creation is locked so callers starting together share a single pool.
 
     Returns:
-        psycopg2.connection or None: Database connection or None if not available
+        psycopg2.pool.ThreadedConnectionPool: Connection pool
+
+    Raises:
+        ImportError: If psycopg2 is not installed
+        Exception: If the database cannot be reached
     """
-    global _ip_source_connection
+    global _ip_source_pool
 
-    if not IP_SOURCE_DATABASE_ENABLED:
-        return None
+    if _ip_source_pool is not None:
+        return _ip_source_pool
 
-    if _ip_source_connection is not None:
-        try:
-            # Test if connection is still alive
-            with _ip_source_connection.cursor() as cursor:
-                cursor.execute('SELECT 1')
-            return _ip_source_connection
-        except:
-            _ip_source_connection = None
+    from psycopg2.pool import ThreadedConnectionPool
 
-    try:
-        import psycopg2
+    with _ip_source_pool_lock:
+        if _ip_source_pool is None:
+            if IP_SOURCE_DATABASE_URL:
+                _ip_source_pool = ThreadedConnectionPool(1, DEFAULT_DATABASE_POOL_SIZE, IP_SOURCE_DATABASE_URL)
+            else:
+                _ip_source_pool = ThreadedConnectionPool(
+                    1, DEFAULT_DATABASE_POOL_SIZE,
+                    host=IP_SOURCE_DB_HOST,
+                    port=IP_SOURCE_DB_PORT,
+                    database=IP_SOURCE_DB_NAME,
+                    user=IP_SOURCE_DB_USER,
+                    password=IP_SOURCE_DB_PASSWORD
+                )
+    return _ip_source_pool
+
+def close_ip_source_pool() -> None:
+    """
+    Close all pooled IP source database connections.
 
-        if IP_SOURCE_DATABASE_URL:
-            _ip_source_connection = psycopg2.connect(IP_SOURCE_DATABASE_URL)
-        else:
-            _ip_source_connection = psycopg2.connect(
-                host=IP_SOURCE_DB_HOST,
-                port=IP_SOURCE_DB_PORT,
-                database=IP_SOURCE_DB_NAME,
-                user=IP_SOURCE_DB_USER,
-                password=IP_SOURCE_DB_PASSWORD
-            )
+    Registered once with atexit.
+    """
+    global _ip_source_pool
 
-        # Auto-commit for simplicity
-        _ip_source_connection.autocommit = True
+    with _ip_source_pool_lock:
+        if _ip_source_pool is not None:
+            _ip_source_pool.closeall()
+            _ip_source_pool = None
 
-        return _ip_source_connection
+atexit.register(close_ip_source_pool)
+
+def _acquire_ip_source_connection():
+    """
+    Take a connection from the IP source pool.
+
+    Returns:
+        tuple: (pool, connection), or (None, None) if not available
+    """
+    try:
+        pool = _get_ip_source_pool()
+        connection = pool.getconn()
+
+        if connection.closed:
+            # Connection is broken; discard it and take a fresh one
+            pool.putconn(connection, close=True)
+            connection = pool.getconn()
+
+        return pool, connection
 
     except ImportError:
         logging.warning("psycopg2 not installed. IP source database disabled.")
-        return None
+        return None, None
     except Exception as e:
         logging.warning(f"IP source database connection failed: {e}")
-        return None
+        return None, None
+
+@contextmanager
+def get_ip_source_connection():
+    """
+    Borrow an IP source database connection from the pool if configured and available.
+
+    The connection is returned to the pool when the block exits.
+
+    Yields:
+        psycopg2.connection or None: Database connection or None if not available
+    """
+    # Return the connection to the pool it came from
+    pool, connection = _acquire_ip_source_connection() if IP_SOURCE_DATABASE_ENABLED else (None, None)
+    try:
+        yield connection
+    finally:
+        if connection is not None:
+            pool.putconn(connection)
+
+@lru_cache(maxsize=16)
+def _read_sql_file(sql_path: str, mtime_ns: int) -> str:
+    """
+    Read and cache SQL file content.
+
+    Args:
+        sql_path: Path to the SQL file
+        mtime_ns: File modification time, so edited files are read again
+
+    Returns:
+        str: Stripped SQL file content
+    """
+    with open(sql_path, 'r', encoding='utf-8') as f:
+        return f.read().strip()
 
 def load_sql_query(sql_file: str) -> Optional[str]:
     """
     Load SQL query from file in data/sql/ directory.
 
+    The file content is cached until its modification time changes.
+
     Args:
         sql_file: SQL filename (e.g., 'get_ips.sql')
 
@@ -77,12 +148,13 @@ def load_sql_query(sql_file: str) -> Optional[str]:
     """
     try:
         sql_path = SQL_DIR / sql_file
-        if not sql_path.exists():
+        try:
+            mtime_ns = sql_path.stat().st_mtime_ns
+        except FileNotFoundError:
             logging.error(f"SQL file not found: {sql_path}")
             return None
 
-        with open(sql_path, 'r', encoding='utf-8') as f:
-            query = f.read().strip()
+        query = _read_sql_file(str(sql_path), mtime_ns)
 
         if not query:
             logging.error(f"SQL file is empty: {sql_path}")
@@ -104,34 +176,55 @@ def get_ips_from_database(sql_file: str = None) -> Optional[List[Tuple[str, Opti
         sql_file: SQL filename (defaults to IP_SOURCE_SQL_FILE from config)
 
     Returns:
-        List[Tuple[str, Optional[str]]]: List of (ip_address, label) tuples or None if failed
+        List[Tuple[str, Optional[str]]]: List of (ip_address, label) tuples; empty if
+        IP_EXCLUDE_CIDRS excluded every address, None if failed or the query returned none
         For single-column queries, label will be None
     """
     if not IP_SOURCE_DATABASE_ENABLED:
         logging.debug("IP source database not configured")
         return None
 
-    connection = get_ip_source_connection()
-    if not connection:
-        logging.warning("IP source database connection not available")
-        return None
-
     sql_file = sql_file or IP_SOURCE_SQL_FILE
     query = load_sql_query(sql_file)
     if not query:
         return None
 
+    with get_ip_source_connection() as connection:
+        if not connection:
+            logging.warning("IP source database connection not available")
+            return None
+
+        return _fetch_ip_data(connection, query, sql_file)
+
+def _fetch_ip_data(connection, query: str, sql_file: str) -> Optional[List[Tuple[str, Optional[str]]]]:
+    """
+    Run the IP source query on a borrowed connection.
+
+    Args:
+        connection: IP source database connection
+        query: SQL query text
+        sql_file: SQL filename, for logging
+
+    Returns:
+        List[Tuple[str, Optional[str]]]: List of (ip_address, label) tuples; empty if
+        IP_EXCLUDE_CIDRS excluded every address, None if failed or the query returned none
+    """
     try:
-        with connection.cursor() as cursor:
+        # Named (server-side) cursor streams rows in IP_SOURCE_FETCH_SIZE chunks
+        # instead of materializing the whole result set. It needs a transaction,
+        # which the pool rolls back when the connection is returned.
+        with connection.cursor(name='ip_source_cursor') as cursor:
+            cursor.itersize = IP_SOURCE_FETCH_SIZE
             cursor.execute(query)
-            results = cursor.fetchall()
 
             # Extract IP addresses and optional labels
             ip_data = []
             seen_ips = set()  # Track unique IPs
+            has_labels = False
 
-            for row in results:
+            for row in cursor:
                 if row and len(row) > 0:
+                    has_labels = len(row) > 1
                     ip = str(row[0]).strip()
                     if ip and ip not in seen_ips:
                         seen_ips.add(ip)
@@ -143,17 +236,108 @@ def get_ips_from_database(sql_file: str = None) -> Optional[List[Tuple[str, Opti
 
                         ip_data.append((ip, label))
 
-            if len(results) > 0 and len(results[0]) > 1:
+            if not ip_data:
+                return None
+
+            # Count after exclusions; an empty list then means everything was excluded,
+            # which callers must not treat as a reason to fall back to another source
+            ip_data = filter_excluded_ips(ip_data)
+            if has_labels:
                 logging.info(f"Retrieved {len(ip_data)} IP addresses with labels from database using {sql_file}")
             else:
                 logging.info(f"Retrieved {len(ip_data)} IP addresses from database using {sql_file}")
-
-            return ip_data if ip_data else None
+            return ip_data
 
     except Exception as e:
         logging.error(f"Failed to get IPs from database: {e}")
         return None
 
+def build_cidr_ranges(cidrs: Iterable[str]) -> Dict[int, Tuple[List[int], List[int]]]:
+    """
+    Precompute CIDR blocks as sorted, merged integer ranges for fast lookups.
+
+    Args:
+        cidrs: CIDR strings such as '10.0.0.0/8' or 'fd00::/8'
+
+    Returns:
+        Dict[int, Tuple[List[int], List[int]]]: Per IP version, (range starts, range ends)
+    """
+    ranges = {4: [], 6: []}
+    for cidr in cidrs:
+        try:
+            network = ipaddress.ip_network(cidr, strict=False)
+        except ValueError:
+            logging.warning(f"Ignoring invalid CIDR block: {cidr}")
+            continue
+        ranges[network.version].append((int(network.network_address), int(network.broadcast_address)))
+
+    lookup = {}
+    for version, bounds in ranges.items():
+        starts, ends = [], []
+        for start, end in sorted(bounds):
+            if ends and start <= ends[-1] + 1:
+                # Overlapping or adjacent block; extend the previous range
+                ends[-1] = max(ends[-1], end)
+            else:
+                starts.append(start)
+                ends.append(end)
+        lookup[version] = (starts, ends)
+    return lookup
+
+def ip_in_any_cidr(ip_string: str, cidr_ranges: Dict[int, Tuple[List[int], List[int]]]) -> bool:
+    """
+    Check whether an IP address falls inside any precomputed CIDR range.
+
+    Args:
+        ip_string: IP address to check
+        cidr_ranges: Ranges from build_cidr_ranges
+
+    Returns:
+        bool: True if the address is inside one of the ranges, False otherwise
+              (including for strings that are not IP addresses)
+    """
+    try:
+        version, packed = 4, socket.inet_pton(socket.AF_INET, ip_string)
+    except OSError:
+        try:
+            version, packed = 6, socket.inet_pton(socket.AF_INET6, ip_string)
+        except OSError:
+            return False
+
+    starts, ends = cidr_ranges[version]
+    value = int.from_bytes(packed, 'big')
+    index = bisect.bisect_right(starts, value) - 1
+    return index >= 0 and value <= ends[index]
+
+@lru_cache(maxsize=None)
+def _get_excluded_ranges() -> Dict[int, Tuple[List[int], List[int]]]:
+    """
+    Get the IP_EXCLUDE_CIDRS ranges, built once per process.
+
+    Returns:
+        Dict[int, Tuple[List[int], List[int]]]: Ranges from build_cidr_ranges
+    """
+    return build_cidr_ranges(IP_EXCLUDE_CIDRS)
+
+def filter_excluded_ips(ip_data: List[Tuple[str, Optional[str]]]) -> List[Tuple[str, Optional[str]]]:
+    """
+    Drop addresses inside the CIDR blocks configured in IP_EXCLUDE_CIDRS.
+
+    Args:
+        ip_data: List of (ip_address, label) tuples
+
+    Returns:
+        List[Tuple[str, Optional[str]]]: The tuples whose address is not excluded
+    """
+    if not IP_EXCLUDE_CIDRS:
+        return ip_data
+
+    cidr_ranges = _get_excluded_ranges()
+    kept = [item for item in ip_data if not ip_in_any_cidr(item[0], cidr_ranges)]
+    if len(kept) < len(ip_data):
+        logging.info(f"Excluded {len(ip_data) - len(kept)} IP addresses inside IP_EXCLUDE_CIDRS")
+    return kept
+
 def is_ip_source_database_enabled() -> bool:
     """
     Check if IP source database functionality is enabled and working.
@@ -165,10 +349,10 @@ def is_ip_source_database_enabled() -> bool:
         logging.debug("IP source database disabled: No environment variables configured")
         return False
 
-    connection = get_ip_source_connection()
-    if connection is None:
-        logging.warning("IP source database enabled in config but connection failed")
-        return False
+    with get_ip_source_connection() as connection:
+        if connection is None:
+            logging.warning("IP source database enabled in config but connection failed")
+            return False
 
     # Check if SQL file exists
     sql_path = SQL_DIR / IP_SOURCE_SQL_FILE
@@ -6,25 +6,175 @@ Reads a list of IP addresses from a text file and tests connectivity
 using ICMP ping. Reports success/failure for each IP.
 """
 
-import subprocess
+import asyncio
+import os
+import re
+import socket
 import sys
+import threading
 import argparse
 import platform
-from concurrent.futures import ThreadPoolExecutor, as_completed
 import time
-from typing import List, Tuple, Optional
+from typing import BinaryIO, Dict, Iterator, List, Tuple, Optional, Union
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache
 from constants import (
     LOGS_DIR, ensure_directories, resolve_ip_file_path,
-    DEFAULT_PING_TIMEOUT, DEFAULT_PING_COUNT, DEFAULT_WORKER_COUNT
+    DEFAULT_PING_TIMEOUT, DEFAULT_PING_COUNT, DEFAULT_WORKER_COUNT, DEFAULT_RESULT_TTL,
+    DEFAULT_DNS_CACHE_TTL, LOG_WRITE_BUFFER_SIZE, RESULT_OUTPUT_CHUNK_SIZE, DEFAULT_DATABASE_BATCH_SIZE
 )
-from database import save_ping_results, is_database_enabled
-from ip_source import get_ips_from_database, is_ip_source_database_enabled
+from database import save_ping_results_async, wait_for_saves, is_database_enabled
+from ip_source import get_ips_from_database, is_ip_source_database_enabled, filter_excluded_ips
+from icmp_ping import address_family, available_families, batch_ping
 
+# (ip_address, success, response_time): a float RTT in ms (or None) on success,
+# an error description on failure
+PingResult = Tuple[str, bool, Union[float, str, None]]
 
-def ping_host(ip_address: str, timeout: int = DEFAULT_PING_TIMEOUT, count: int = DEFAULT_PING_COUNT) -> Tuple[str, bool, str]:
+# System ping syntax differs on Windows; the platform never changes while running
+_IS_WINDOWS = platform.system().lower() == 'windows'
+
+# Average round trip from the quiet (-q) summary line on Unix,
+# e.g. "rtt min/avg/max/mdev = 0.045/0.052/0.060/0.007 ms"
+_PING_RTT_RE = re.compile(rb"= [\d.]+/([\d.]+)/")
+
+# Per-reply response time in ping output, e.g. "time=12ms" (Windows) or "time=0.045 ms"
+_PING_TIME_RE = re.compile(rb"time=(\d+(?:\.\d+)*)\s*ms")
+
+# Recent results per IP and ping settings, shared by all ping_hosts calls in this process:
+# (ip_address, timeout, count) -> (monotonic time, success, response_time)
+_ping_cache: Dict[Tuple[str, int, int], Tuple[float, bool, Union[float, str, None]]] = {}
+_ping_cache_lock = threading.Lock()
+
+# Resolved hostnames, shared by all ping_hosts calls in this process:
+# hostname -> (monotonic expiry time, ((family, address), ...))
+_dns_cache: Dict[str, Tuple[float, Tuple[Tuple[int, str], ...]]] = {}
+_dns_cache_lock = threading.Lock()
+_dns_cache_next_prune = 0.0  # Monotonic time after which expired answers are dropped
+
+# Up to this many hostnames are resolved in the calling thread; starting a
+# thread pool costs more than a few lookups in sequence
+_SERIAL_RESOLVE_LIMIT = 4
+
+# Event loop for system ping fallbacks, kept per thread and reused across calls
+# (daemon jobs run on the scheduler's reused worker threads)
+_loop_local = threading.local()
+
+# Entry on each line of an IP list file: the text before any "#" comment,
+# without surrounding whitespace (empty for blank and comment-only lines)
+_IP_LINE_RE = re.compile(rb'^[^\S\n]*([^#\n]*?)[^\S\n]*(?:#|$)', re.MULTILINE)
+
+# Terminal colors for result lines, left out when stdout is not a terminal
+_USE_COLOR = sys.stdout.isatty()
+
+# Result lines go out one at a time on a terminal, for live progress, and in
+# chunks otherwise (pipes and files)
+_OUTPUT_CHUNK_SIZE = 1 if _USE_COLOR else RESULT_OUTPUT_CHUNK_SIZE
+COLOR_GREEN = "\033[92m" if _USE_COLOR else ""
+COLOR_RED = "\033[91m" if _USE_COLOR else ""
+COLOR_RESET = "\033[0m" if _USE_COLOR else ""
+
+# Result line templates with the color and status text baked in: (ip_address, response)
+_REACHABLE_LINE = f"{COLOR_GREEN}{{:<15}} {'✓ REACHABLE':<12} {{}}{COLOR_RESET}\n".format
+_UNREACHABLE_LINE = f"{COLOR_RED}{{:<15}} {'✗ UNREACHABLE':<12} {{}}{COLOR_RESET}\n".format
+
+
+def _ping_command(ip_address: str, timeout: int, count: int) -> List[str]:
     """
-    Ping a single host using system ping command.
+    Build the system ping command with OS-specific parameters.
+
+    Args:
+        ip_address (str): IP address to ping
+        timeout (int): Timeout in seconds
+        count (int): Number of ping packets
+
+    Returns:
+        list: Command line arguments
+    """
+    if _IS_WINDOWS:
+        # Windows: ping -n count -w timeout_ms ip
+        return ['ping', '-n', str(count), '-w', str(timeout * 1000), ip_address]
+    # Unix/Linux/macOS: ping -n [-q] -c count -W timeout ip
+    # (numeric output without reverse DNS lookups; with several packets only the
+    # summary is needed, a single packet is read from its reply line)
+    quiet = ['-q'] if count > 1 else []
+    return ['ping', '-n', *quiet, '-c', str(count), '-W', str(timeout), ip_address]
+
+
+def _parse_ping_output(ip_address: str, returncode: int, stdout: bytes) -> PingResult:
+    """
+    Turn system ping output into a ping result.
+
+    Args:
+        ip_address (str): IP address that was pinged
+        returncode (int): Exit status of the ping command
+        stdout (bytes): Raw output of the ping command
+
+    Returns:
+        tuple: (ip_address, success, response_time)
+    """
+    if returncode == 0:
+        # Extract response time from the raw bytes without decoding the output
+        match = (_PING_TIME_RE if _IS_WINDOWS else _PING_RTT_RE).search(stdout)
+        if match:
+            response_time = float(match.group(1))
+            return (ip_address, True, response_time)
+        return (ip_address, True, None)
+    else:
+        return (ip_address, False, "No response")
+
+
+def ping_host(ip_address: str, timeout: int = DEFAULT_PING_TIMEOUT, count: int = DEFAULT_PING_COUNT) -> PingResult:
+    """
+    Ping a single host over an ICMP socket when available, otherwise with system ping command.
+
+    Args:
+        ip_address (str): IP address to ping
+        timeout (int): Timeout in seconds
+        count (int): Number of ping packets
+
+    Returns:
+        tuple: (ip_address, success, response_time)
+    """
+    literal = address_family(ip_address)
+    if literal is not None and literal[0] in available_families():
+        ip_address, success, response_info, _ = next(batch_ping([(ip_address, None)], timeout, count))
+        return (ip_address, success, response_info)
+
+    return _get_event_loop().run_until_complete(_system_ping_async(ip_address, timeout, count))
+
+
+async def _read_first_reply(process: asyncio.subprocess.Process) -> Tuple[Optional[float], bytes]:
+    """
+    Read system ping output until the first reply line, then stop the ping.
+
+    Args:
+        process: Running ping command with piped stdout
+
+    Returns:
+        tuple: (response_time, b'') once a reply line with a time is read, or
+               (None, output) if ping exited without one
+    """
+    lines = []
+    async for line in process.stdout:
+        match = _PING_TIME_RE.search(line)
+        if match:
+            try:
+                process.kill()
+            except ProcessLookupError:
+                pass
+            await process.wait()
+            return float(match.group(1)), b''
+        lines.append(line)
+
+    await process.wait()
+    return None, b''.join(lines)
+
+
+async def _system_ping_async(ip_address: str, timeout: int, count: int) -> PingResult:
+    """
+    Ping a single host using system ping command without blocking the event loop.
 
     Args:
         ip_address (str): IP address to ping
@@ -35,38 +185,283 @@ def ping_host(ip_address: str, timeout: int = DEFAULT_PING_TIMEOUT, count: int =
         tuple: (ip_address, success, response_time)
     """
     try:
-        # Use system ping command with OS-specific parameters
-        if platform.system().lower() == 'windows':
-            # Windows: ping -n count -w timeout_ms ip
-            cmd = ['ping', '-n', str(count), '-w', str(timeout * 1000), ip_address]
-        else:
-            # Unix/Linux/macOS: ping -c count -W timeout ip
-            cmd = ['ping', '-c', str(count), '-W', str(timeout), ip_address]
-
-        result = subprocess.run(cmd, capture_output=True, text=True, timeout=timeout+2)
-
-        if result.returncode == 0:
-            # Extract response time from ping output using regex
-            import re
-            time_pattern = r"time=(\d+(?:\.\d+)*)\s*ms"
-            match = re.search(time_pattern, result.stdout)
-            if match:
-                response_time = float(match.group(1))
-                return (ip_address, True, response_time)
-            return (ip_address, True, None)
-        else:
-            return (ip_address, False, "No response")
+        process = await asyncio.create_subprocess_exec(
+            *_ping_command(ip_address, timeout, count),
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.DEVNULL
+        )
+        try:
+            if count == 1:
+                # A single reply is all we need: take it as soon as it arrives
+                # instead of waiting for ping to print its summary and exit
+                response_time, stdout = await asyncio.wait_for(_read_first_reply(process), timeout + 2)
+                if response_time is not None:
+                    return (ip_address, True, response_time)
+            else:
+                stdout, _ = await asyncio.wait_for(process.communicate(), timeout + 2)
+        except asyncio.TimeoutError:
+            try:
+                process.kill()
+            except ProcessLookupError:  # Already stopped by _read_first_reply
+                pass
+            await process.wait()
+            return (ip_address, False, "Timeout")
+
+        return _parse_ping_output(ip_address, process.returncode, stdout)
 
-    except subprocess.TimeoutExpired:
-        return (ip_address, False, "Timeout")
     except Exception as e:
         return (ip_address, False, f"Error: {str(e)}")
 
 
+async def _ping_worker(hosts: Iterator[Tuple[str, Optional[str]]], results: asyncio.Queue,
+                       timeout: int, count: int) -> None:
+    """
+    Ping hosts from a shared iterator until it is exhausted, queueing each result.
+
+    Args:
+        hosts: Shared iterator of (ip_address, label) tuples
+        results: Queue receiving (ip_address, success, response_time, label) tuples
+        timeout (int): Timeout in seconds
+        count (int): Number of ping packets
+    """
+    for ip, label in hosts:
+        try:
+            ip_address, success, response_info = await _system_ping_async(ip, timeout, count)
+        except Exception as e:
+            ip_address, success, response_info = ip, False, f"Error: {str(e)}"
+        results.put_nowait((ip_address, success, response_info, label))
+
+
+async def _new_queue() -> asyncio.Queue:
+    """
+    Create a queue bound to the running event loop.
+
+    Before Python 3.10 a queue binds to the loop current at construction time,
+    so it must be created from a coroutine running on the loop that uses it.
+
+    Returns:
+        asyncio.Queue: Empty queue
+    """
+    return asyncio.Queue()
+
+
+def _get_event_loop() -> asyncio.AbstractEventLoop:
+    """
+    Get this thread's event loop for system pings, creating it on first use.
+
+    Returns:
+        asyncio.AbstractEventLoop: Event loop owned by the calling thread
+    """
+    loop = getattr(_loop_local, 'loop', None)
+    if loop is None or loop.is_closed():
+        loop = _loop_local.loop = asyncio.new_event_loop()
+    return loop
+
+
+def _system_ping_hosts(ip_list: List[Tuple[str, Optional[str]]], timeout: int, count: int, workers: int
+                       ) -> Iterator[Tuple[str, bool, Union[float, str, None], Optional[str]]]:
+    """
+    Ping hosts with the system ping command, yielding each result as it becomes available.
+
+    All pings run as non-blocking subprocesses on the calling thread's asyncio
+    event loop with at most `workers` in flight.
+
+    Args:
+        ip_list: List of (ip_address, label) tuples
+        timeout (int): Timeout in seconds
+        count (int): Number of ping packets
+        workers (int): Number of concurrent pings
+
+    Yields:
+        tuple: (ip_address, success, response_time, label)
+    """
+    loop = _get_event_loop()
+    results = loop.run_until_complete(_new_queue())
+    hosts = iter(ip_list)
+    tasks = [
+        loop.create_task(_ping_worker(hosts, results, timeout, count))
+        for _ in range(min(workers, len(ip_list)))
+    ]
+
+    try:
+        for _ in range(len(ip_list)):
+            yield loop.run_until_complete(results.get())
+    finally:
+        for task in tasks:
+            task.cancel()
+        if tasks:
+            loop.run_until_complete(asyncio.gather(*tasks, return_exceptions=True))
+
+
+def resolve_host(hostname: str) -> Tuple[Tuple[int, str], ...]:
+    """
+    Resolve a hostname to its addresses, reusing the answer for DEFAULT_DNS_CACHE_TTL seconds.
+
+    Args:
+        hostname (str): Hostname to resolve
+
+    Returns:
+        tuple: (family, address) tuples in resolver order; empty if it does not resolve
+    """
+    global _dns_cache_next_prune
+
+    now = time.monotonic()
+    with _dns_cache_lock:
+        entry = _dns_cache.get(hostname)
+    if entry is not None and entry[0] > now:
+        return entry[1]
+
+    try:
+        infos = socket.getaddrinfo(hostname, None, type=socket.SOCK_RAW)
+    except (OSError, UnicodeError):
+        return ()
+
+    addresses = tuple(dict.fromkeys((info[0], info[4][0]) for info in infos))
+    with _dns_cache_lock:
+        # Once per TTL, drop expired answers so hostnames no longer pinged do not pile up
+        if now >= _dns_cache_next_prune:
+            expired = [name for name, cached in _dns_cache.items() if cached[0] <= now]
+            for name in expired:
+                del _dns_cache[name]
+            _dns_cache_next_prune = now + DEFAULT_DNS_CACHE_TTL
+        _dns_cache[hostname] = (now + DEFAULT_DNS_CACHE_TTL, addresses)
+    return addresses
+
+
+def _ping_uncached(ip_list: List[Tuple[str, Optional[str]]], timeout: int, count: int, workers: int
+                   ) -> Iterator[Tuple[str, bool, Union[float, str, None], Optional[str]]]:
+    """
+    Ping a list of hosts, yielding each result as it becomes available.
+
+    IP literals, and hostnames once resolved (see resolve_host), are pinged in
+    one batch over shared ICMP sockets (see icmp_ping); hostname results are
+    reported under the hostname. Unresolvable hostnames, and addresses whose
+    family has no usable ICMP socket, fall back to the system ping command.
+
+    Args:
+        ip_list: List of (ip_address, label) tuples
+        timeout (int): Timeout in seconds
+        count (int): Number of ping packets
+        workers (int): Number of hosts pinged at once
+
+    Yields:
+        tuple: (ip_address, success, response_time, label)
+    """
+    families = available_families()
+    batched, hostnames, fallback = [], [], []
+    for item in ip_list:
+        literal = address_family(item[0])
+        if literal is None:
+            hostnames.append(item)
+        elif literal[0] in families:
+            batched.append((item[0], item))
+        else:
+            fallback.append(item)
+
+    if hostnames:
+        names = [hostname for hostname, _ in hostnames]
+        if len(names) > _SERIAL_RESOLVE_LIMIT:
+            with ThreadPoolExecutor(max_workers=min(workers, len(names))) as executor:
+                resolved = list(executor.map(resolve_host, names))
+        else:
+            resolved = [resolve_host(name) for name in names]
+
+        for item, addresses in zip(hostnames, resolved):
+            # Skip addresses batch_ping can't use, e.g. scoped IPv6 link-local ones
+            address = next((address for family, address in addresses
+                            if family in families and address_family(address)), None)
+            if address is not None:
+                batched.append((address, item))
+            else:
+                fallback.append(item)
+
+    # Each batch_ping label carries the original (host, label) item to report under
+    if batched:
+        for _, success, response_info, (host, label) in batch_ping(batched, timeout, count, workers):
+            yield (host, success, response_info, label)
+    if fallback:
+        yield from _system_ping_hosts(fallback, timeout, count, workers)
+
+
+def ping_hosts(ip_list: List[Tuple[str, Optional[str]]], timeout: int = DEFAULT_PING_TIMEOUT,
+               count: int = DEFAULT_PING_COUNT, workers: int = DEFAULT_WORKER_COUNT,
+               result_ttl: float = DEFAULT_RESULT_TTL
+               ) -> Iterator[Tuple[str, bool, Union[float, str, None], Optional[str]]]:
+    """
+    Ping a list of hosts, yielding each result as it becomes available.
+
+    Results younger than `result_ttl` seconds, from any earlier call in this
+    process with the same timeout and count (e.g. an overlapping daemon job),
+    are reused instead of pinging again.
+
+    Args:
+        ip_list: List of (ip_address, label) tuples
+        timeout (int): Timeout in seconds
+        count (int): Number of ping packets
+        workers (int): Number of hosts pinged at once
+        result_ttl (float): Seconds to reuse a previous result (0 disables)
+
+    Yields:
+        tuple: (ip_address, success, response_time, label)
+    """
+    if result_ttl <= 0:
+        yield from _ping_uncached(ip_list, timeout, count, workers)
+        return
+
+    cached, to_ping = [], []
+    now = time.monotonic()
+    with _ping_cache_lock:
+        # Drop expired results so the cache does not grow for the daemon's lifetime
+        expired = [key for key, hit in _ping_cache.items() if now - hit[0] >= result_ttl]
+        for key in expired:
+            del _ping_cache[key]
+
+        for ip_address, label in ip_list:
+            hit = _ping_cache.get((ip_address, timeout, count))
+            if hit is not None:
+                cached.append((ip_address, hit[1], hit[2], label))
+            else:
+                to_ping.append((ip_address, label))
+
+    yield from cached
+
+    for result in _ping_uncached(to_ping, timeout, count, workers):
+        with _ping_cache_lock:
+            _ping_cache[(result[0], timeout, count)] = (time.monotonic(), result[1], result[2])
+        yield result
+
+
+@lru_cache(maxsize=16)
+def _parse_ip_file(file_path: str, mtime_ns: int, size: int) -> Tuple[str, ...]:
+    """
+    Parse and cache the IP addresses in a text file.
+
+    Args:
+        file_path (str): Path to the text file containing IP addresses
+        mtime_ns (int): File modification time, so edited files are parsed again
+        size (int): File size, as a second change check
+
+    Returns:
+        tuple: Unique IP addresses in file order
+    """
+    # Extract every line's entry in one regex pass over the raw bytes
+    with open(file_path, 'rb') as file:
+        entries = _IP_LINE_RE.findall(file.read())
+
+    # dict.fromkeys dedups while keeping file order, so pings and logs follow the file
+    ips = dict.fromkeys(entries)
+    ips.pop(b'', None)
+    return tuple(ip.decode() for ip in ips)
+
+
 def read_ip_list(file_path: str) -> List[str]:
     """
     Read IP addresses from a text file.
 
+    Duplicates are removed; the first occurrence of each address keeps its place.
+    The parsed list is cached until the file changes, so scheduled daemon jobs
+    only pay for a stat() when their IP file is unchanged.
+
     Args:
         file_path (str): Path to the text file containing IP addresses
 
@@ -74,15 +469,8 @@ def read_ip_list(file_path: str) -> List[str]:
         list: List of IP addresses
     """
     try:
-        import re
-        with open(file_path, 'r') as file:
-            ips = set()
-            for _, line in enumerate(file, 1):
-                # Remove comments using regex
-                line = re.sub(r'#.*$', '', line).strip()
-                if line:
-                    ips.add(line)
-            return list(ips)
+        stat = os.stat(file_path)
+        return list(_parse_ip_file(file_path, stat.st_mtime_ns, stat.st_size))
     except FileNotFoundError:
         print(f"Error: File '{file_path}' not found.")
         sys.exit(1)
@@ -91,12 +479,16 @@ def read_ip_list(file_path: str) -> List[str]:
         sys.exit(1)
 
 
-def setup_logging() -> Tuple[str, str]:
+def setup_logging() -> Tuple[BinaryIO, BinaryIO]:
     """
-    Create log directory and return paths for success and failure log files.
+    Create log directory and open the success and failure log files for this run.
+
+    The files are opened once, in binary append mode with a large write
+    buffer; callers close them when the run ends (e.g. `with success_file,
+    failure_file:`).
 
     Returns:
-        tuple: (success_log_path, failure_log_path)
+        tuple: (success_file, failure_file)
     """
     # Ensure logs directory exists
     ensure_directories()
@@ -107,10 +499,11 @@ def setup_logging() -> Tuple[str, str]:
     success_log = LOGS_DIR / f"{timestamp}_successful.txt"
     failure_log = LOGS_DIR / f"{timestamp}_failed.txt"
 
-    return str(success_log), str(failure_log)
+    return (open(success_log, 'ab', buffering=LOG_WRITE_BUFFER_SIZE),
+            open(failure_log, 'ab', buffering=LOG_WRITE_BUFFER_SIZE))
 
 
-def log_result(ip_address: str, success: bool, response_info: str, success_log: str, failure_log: str) -> None:
+def log_result(ip_address: str, success: bool, response_info: str, success_file: BinaryIO, failure_file: BinaryIO) -> None:
     """
     Log ping result to appropriate file.
 
@@ -118,10 +511,10 @@ def log_result(ip_address: str, success: bool, response_info: str, success_log:
         ip_address: IP address that was pinged
         success: Whether the ping was successful
         response_info: Response time or error information
-        success_log: Path to success log file
-        failure_log: Path to failure log file
+        success_file: Open success log file
+        failure_file: Open failure log file
     """
-    log_file = success_log if success else failure_log
+    log_file = success_file if success else failure_file
     status = "SUCCESS" if success else "FAILED"
 
     # Format response_info for file logging
@@ -130,27 +523,32 @@ def log_result(ip_address: str, success: bool, response_info: str, success_log:
     else:
         response_display = str(response_info) if response_info is not None else "N/A"
 
-    with open(log_file, 'a') as f:
-        f.write(f"{ip_address}\t{status}\t{response_display}\n")
+    log_file.write(f"{ip_address}\t{status}\t{response_display}\n".encode())
 
 
-def get_ip_list(ip_file: str = None, sql_file: str = None) -> List[Tuple[str, Optional[str]]]:
+def get_ip_list(ip_file: str = None, sql_file: str = None, ip_source_enabled: bool = None) -> List[Tuple[str, Optional[str]]]:
     """
     Get IP addresses from file or database source.
 
     Args:
         ip_file: Text file containing IP addresses (optional)
         sql_file: SQL file for database query (optional)
+        ip_source_enabled: Result of an earlier is_ip_source_database_enabled() check (optional)
 
     Returns:
         List[Tuple[str, Optional[str]]]: List of (ip_address, label) tuples
         For file sources, label will be None
     """
+    if ip_source_enabled is None:
+        ip_source_enabled = is_ip_source_database_enabled()
+
     # Try database source first if enabled
-    if is_ip_source_database_enabled():
+    if ip_source_enabled:
         try:
             db_ips = get_ips_from_database(sql_file)
-            if db_ips:
+            if db_ips is not None:
+                # An empty list means IP_EXCLUDE_CIDRS excluded every address; don't
+                # fall back to the file and ping the addresses meant to be skipped
                 print(f"Using {len(db_ips)} IP addresses from database")
                 return db_ips
         except Exception as e:
@@ -173,7 +571,7 @@ def get_ip_list(ip_file: str = None, sql_file: str = None) -> List[Tuple[str, Op
         sys.exit(1)
 
     # Convert file IPs to tuple format (ip, label=None)
-    ip_list = [(ip, None) for ip in ip_strings]
+    ip_list = filter_excluded_ips([(ip, None) for ip in ip_strings])
     print(f"Using {len(ip_list)} IP addresses from file: {ip_file_path}")
     return ip_list
 
@@ -183,7 +581,7 @@ def parse_args() -> argparse.Namespace:
     Parse command line arguments and validate input file.
 
     Returns:
-        argparse.Namespace: Parsed arguments with validated ip_file
+        argparse.Namespace: Parsed arguments with validated ip_file and ip_source_enabled
     """
     parser = argparse.ArgumentParser(description='Check connectivity to a list of IP addresses using ICMP ping')
     parser.add_argument('ip_file', nargs='?', help='Text file containing IP addresses (one per line, optional if database configured)')
@@ -191,12 +589,15 @@ def parse_args() -> argparse.Namespace:
     parser.add_argument('-t', '--timeout', type=int, default=DEFAULT_PING_TIMEOUT, help=f'Ping timeout in seconds (default: {DEFAULT_PING_TIMEOUT})')
     parser.add_argument('-c', '--count', type=int, default=DEFAULT_PING_COUNT, help=f'Number of ping packets (default: {DEFAULT_PING_COUNT})')
     parser.add_argument('-w', '--workers', type=int, default=DEFAULT_WORKER_COUNT, help=f'Number of concurrent workers (default: {DEFAULT_WORKER_COUNT})')
+    parser.add_argument('--result-ttl', type=float, default=DEFAULT_RESULT_TTL, help=f'Seconds to reuse a recent result for the same IP, timeout and count, 0 to disable (default: {DEFAULT_RESULT_TTL})')
     parser.add_argument('-v', '--verbose', action='store_true', help='Verbose output')
 
     args = parser.parse_args()
 
-    # Check if we have at least one IP source
-    if not args.ip_file and not is_ip_source_database_enabled():
+    # Check if we have at least one IP source; keep the result so get_ip_list
+    # does not probe the IP source database again
+    args.ip_source_enabled = is_ip_source_database_enabled()
+    if not args.ip_file and not args.ip_source_enabled:
         print("Error: No IP source available. Provide an IP file or configure database IP source.")
         print("Set IP_SOURCE_DATABASE_URL or IP_SOURCE_DB_* environment variables.")
         sys.exit(1)
@@ -206,64 +607,71 @@ def parse_args() -> argparse.Namespace:
 
 def main() -> None:
     args = parse_args()
-    ip_list = get_ip_list(args.ip_file, args.sql_file)
+    ip_list = get_ip_list(args.ip_file, args.sql_file, args.ip_source_enabled)
 
     # Setup logging
-    success_log, failure_log = setup_logging()
+    success_file, failure_file = setup_logging()
 
     print(f"Testing connectivity to {len(ip_list)} IP addresses...")
     print(f"Timeout: {args.timeout}s, Count: {args.count}, Workers: {args.workers}")
-    print(f"Logs will be saved to: {success_log} and {failure_log}")
+    print(f"Logs will be saved to: {success_file.name} and {failure_file.name}")
     print("-" * 60)
 
     start_time = time.time()
     successful = 0
     failed = 0
-    all_results = []  # Collect all results for database
-
-    # Use ThreadPoolExecutor for concurrent pings
-    with ThreadPoolExecutor(max_workers=args.workers) as executor:
-        # Submit all ping tasks with IP and label mapping
-        future_to_ip_data = {
-            executor.submit(ping_host, ip, args.timeout, args.count): (ip, label)
-            for ip, label in ip_list
-        }
-
-        # Process results as they complete
-        for future in as_completed(future_to_ip_data):
-            ip_address, success, response_info = future.result()
-            _, label = future_to_ip_data[future]  # Get label from mapping
-
-            # Collect result for database (now includes label)
-            all_results.append((ip_address, success, response_info, label))
+    batch_results = []  # Results waiting to be queued for the database
+    saves = []  # Futures of the batches queued for the database
+    held = []  # Full batches the writer queue had no room for, queued after pinging
+    database_enabled = is_database_enabled()
+    output_lines = []  # Result lines waiting to be written to stdout
+
+    # Both log files stay open for the whole run and are closed once at the end
+    with success_file, failure_file:
+        # Ping all hosts concurrently and process results as they arrive
+        for ip_address, success, response_info, label in ping_hosts(ip_list, args.timeout, args.count, args.workers, args.result_ttl):
+            # Hand results to the background database writer in batches, so
+            # inserts overlap with the remaining pings; never block on a full
+            # writer queue here, which would stall the ICMP receive loop
+            if database_enabled:
+                batch_results.append((ip_address, success, response_info, label))
+                if len(batch_results) >= DEFAULT_DATABASE_BATCH_SIZE:
+                    held.append(batch_results)
+                    batch_results = []
+                    while held:
+                        future = save_ping_results_async(held[0], timeout=args.timeout, count=args.count, block=False)
+                        if future is None:
+                            break
+                        saves.append(future)
+                        held.pop(0)
 
             # Log the result
-            log_result(ip_address, success, response_info, success_log, failure_log)
+            log_result(ip_address, success, response_info, success_file, failure_file)
 
             if success:
                 successful += 1
-                status = "✓ REACHABLE"
-                color = "\033[92m"  # Green
                 response_display = f"{response_info:.1f}ms" if response_info is not None else "N/A"
+                output_lines.append(_REACHABLE_LINE(ip_address, response_display))
             else:
                 failed += 1
-                status = "✗ UNREACHABLE"
-                color = "\033[91m"  # Red
-                response_display = response_info
-
-            reset_color = "\033[0m"
+                output_lines.append(_UNREACHABLE_LINE(ip_address, response_info))
+            if len(output_lines) >= _OUTPUT_CHUNK_SIZE:
+                sys.stdout.write("".join(output_lines))
+                output_lines.clear()
 
-            if args.verbose or not success:
-                print(f"{color}{ip_address:<15} {status:<12} {response_display}{reset_color}")
-            elif success:
-                print(f"{color}{ip_address:<15} {status:<12} {response_display}{reset_color}")
+        sys.stdout.write("".join(output_lines))
+        sys.stdout.flush()
 
     end_time = time.time()
 
-    # Save to database if configured
-    if is_database_enabled():
+    # Queue the held and last partial batches and wait for the writer to save this run's batches
+    if database_enabled:
         try:
-            if save_ping_results(all_results, timeout=args.timeout, count=args.count):
+            if batch_results:
+                held.append(batch_results)
+            for batch in held:
+                saves.append(save_ping_results_async(batch, timeout=args.timeout, count=args.count))
+            if wait_for_saves(saves):
                 print("✓ Results saved to database")
             else:
                 print("⚠ Failed to save results to database")
@@ -19,12 +19,11 @@ from apscheduler.events import EVENT_JOB_EXECUTED, EVENT_JOB_ERROR
 # Import constants and ping functionality
 from constants import (
     DAEMON_CONFIG_FILE, DAEMON_LOG_FILE, resolve_ip_file_path,
-    DEFAULT_DATABASE_BATCH_SIZE
+    DEFAULT_DATABASE_BATCH_SIZE, DEFAULT_RESULT_TTL, DEFAULT_JOB_MISFIRE_GRACE_TIME, DEFAULT_WORKER_COUNT
 )
-from ping_checker import read_ip_list, setup_logging, ping_host, log_result, get_ip_list
-from database import save_ping_results, is_database_enabled
+from ping_checker import read_ip_list, setup_logging, ping_hosts, log_result, get_ip_list
+from database import save_ping_results_async, wait_for_saves, is_database_enabled
 from ip_source import get_ips_from_database, is_ip_source_database_enabled
-from concurrent.futures import ThreadPoolExecutor, as_completed
 
 
 class PingDaemon:
@@ -89,7 +88,8 @@ class PingDaemon:
 
         return config
 
-    def ping_job(self, job_name: str, ip_file: str = None, sql_file: str = None, timeout: int = 3, count: int = 1, workers: int = 10):
+    def ping_job(self, job_name: str, ip_file: str = None, sql_file: str = None, timeout: int = 3, count: int = 1, workers: int = DEFAULT_WORKER_COUNT,
+                 result_ttl: float = DEFAULT_RESULT_TTL):
         """
         Execute a ping job with specified parameters
 
@@ -100,6 +100,7 @@ class PingDaemon:
             timeout: Ping timeout in seconds
             count: Number of ping packets
             workers: Number of concurrent workers
+            result_ttl: Seconds to reuse a recent result for the same IP (0 disables)
         """
         self.logger.info(f"Starting ping job '{job_name}'")
 
@@ -111,7 +112,7 @@ class PingDaemon:
                 return
 
             # Setup logging for this job
-            success_log, failure_log = setup_logging()
+            success_file, failure_file = setup_logging()
 
             self.logger.info(f"Job '{job_name}': Testing {len(ip_list)} IPs (timeout={timeout}s, workers={workers})")
 
@@ -120,28 +121,23 @@ class PingDaemon:
             failed = 0
             processed = 0
             total_ips = len(ip_list)
-            all_results = []  # Collect all results for database
             batch_results = []  # For batched database saves
+            saves = []  # Futures of this job's queued database batches
+            held = []  # Full batches the writer queue had no room for, queued after pinging
             batch_size = DEFAULT_DATABASE_BATCH_SIZE  # Save to database in configurable batches
+            database_enabled = is_database_enabled()  # Check once per job, not per result
 
-            # Execute pings concurrently
-            with ThreadPoolExecutor(max_workers=workers) as executor:
-                future_to_ip_data = {
-                    executor.submit(ping_host, ip, timeout, count): (ip, label)
-                    for ip, label in ip_list
-                }
-
-                for future in as_completed(future_to_ip_data):
-                    ip_address, success, response_info = future.result()
-                    _, label = future_to_ip_data[future]  # Get label from mapping
+            # Both log files stay open for the whole job and are closed once at the end
+            with success_file, failure_file:
+                # Execute pings concurrently
+                for ip_address, success, response_info, label in ping_hosts(ip_list, timeout, count, workers, result_ttl):
                     processed += 1
 
-                    # Collect result for final database save (now includes label)
-                    all_results.append((ip_address, success, response_info, label))
-                    batch_results.append((ip_address, success, response_info, label))
+                    if database_enabled:
+                        batch_results.append((ip_address, success, response_info, label))
 
                     # Log the result to files
-                    log_result(ip_address, success, response_info, success_log, failure_log)
+                    log_result(ip_address, success, response_info, success_file, failure_file)
 
                     # Show real-time progress in logs
                     progress = f"({processed}/{total_ips})"
@@ -155,28 +151,38 @@ class PingDaemon:
                         status = "✗ UNREACHABLE"
                         self.logger.warning(f"Job '{job_name}': {ip_address:<15} {status:<12} {response_info} - processed: {progress}")
 
-                    # Save to database in batches for better performance
-                    if is_database_enabled() and len(batch_results) >= batch_size:
-                        try:
-                            if save_ping_results(batch_results, job_name=job_name, timeout=timeout, count=count):
-                                self.logger.debug(f"Job '{job_name}': Saved batch of {len(batch_results)} results to database")
-                            batch_results = []  # Clear batch after saving
-                        except Exception as e:
-                            self.logger.error(f"Job '{job_name}': Batch database save error: {e}")
+                    # Hand batches to the background database writer so pings never wait on
+                    # it; a batch that finds the writer queue full is held until pinging ends
+                    if database_enabled and len(batch_results) >= batch_size:
+                        held.append(batch_results)
+                        batch_results = []  # Clear batch after handing it over
+                        while held:
+                            future = save_ping_results_async(held[0], job_name=job_name, timeout=timeout,
+                                                             count=count, block=False)
+                            if future is None:
+                                break
+                            saves.append(future)
+                            self.logger.debug(f"Job '{job_name}': Queued batch of {len(held.pop(0))} results for database")
 
             duration = time.time() - start_time
 
-            # Save any remaining results to database
-            if is_database_enabled() and batch_results:
-                try:
-                    if save_ping_results(batch_results, job_name=job_name, timeout=timeout, count=count):
-                        self.logger.debug(f"Job '{job_name}': Saved final batch of {len(batch_results)} results to database")
-                except Exception as e:
-                    self.logger.error(f"Job '{job_name}': Final batch database save error: {e}")
+            # Queue any remaining results and wait for the writer to save this job's batches
+            # (other jobs' batches are not waited on)
+            if database_enabled:
+                if batch_results:
+                    held.append(batch_results)
+                for batch in held:
+                    saves.append(save_ping_results_async(batch, job_name=job_name, timeout=timeout, count=count))
+                if held:
+                    self.logger.debug(f"Job '{job_name}': Queued {len(held)} final batches for database")
+                database_saved = wait_for_saves(saves)
 
             # Log database save summary
-            if is_database_enabled():
-                self.logger.info(f"Job '{job_name}': All {len(all_results)} results saved to database")
+            if database_enabled:
+                if database_saved:
+                    self.logger.info(f"Job '{job_name}': All {processed} results saved to database")
+                else:
+                    self.logger.warning(f"Job '{job_name}': Some results could not be saved to database")
             else:
                 self.logger.debug(f"Job '{job_name}': Database logging disabled")
 
@@ -189,6 +195,9 @@ class PingDaemon:
         """Load and add all jobs from configuration file"""
         config = self.load_config()
 
+        # Daemon-wide defaults from the optional [defaults] section
+        default_result_ttl = config.getfloat('defaults', 'result_ttl', fallback=DEFAULT_RESULT_TTL)
+
         job_count = 0
         for section_name in config.sections():
             if section_name.startswith('job:'):
@@ -213,7 +222,8 @@ class PingDaemon:
                 # Optional parameters with defaults
                 timeout = section.getint('timeout', 3)
                 count = section.getint('count', 1)
-                workers = section.getint('workers', 10)
+                workers = section.getint('workers', DEFAULT_WORKER_COUNT)
+                result_ttl = section.getfloat('result_ttl', default_result_ttl)
 
                 try:
                     # Parse cron schedule
@@ -240,11 +250,17 @@ class PingDaemon:
                             'sql_file': sql_file,
                             'timeout': timeout,
                             'count': count,
-                            'workers': workers
+                            'workers': workers,
+                            'result_ttl': result_ttl
                         },
                         id=f"ping_job_{job_name}",
                         name=f"Ping Job: {job_name}",
-                        replace_existing=True
+                        replace_existing=True,
+                        # A run that outlasts its period must not overlap the next one;
+                        # runs missed meanwhile collapse into a single catch-up run
+                        coalesce=True,
+                        max_instances=1,
+                        misfire_grace_time=DEFAULT_JOB_MISFIRE_GRACE_TIME
                     )
 
                     source_info = f"file={ip_file}" if ip_file else f"sql={sql_file}" if sql_file else "database"